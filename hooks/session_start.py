@@ -338,7 +338,7 @@ class MCPContextProvider(ContextProvider):
             mcp_server_url = self._get_mcp_url_from_config()
             main_logger.debug(f"MCP URL from config: {mcp_server_url}")
 
-            # TokenManager always reads fresh token from .mcp.json (no cache)
+            # TokenManager rereads .mcp.json whenever the file changes
             from utils.mcp_client import MCPHTTPClient
 
             client = MCPHTTPClient()
@@ -10,46 +10,132 @@ Usage:
     delegate_to_agent("debugger-agent", "Fix this critical bug")
 """
 
+import re
+import sys
 from typing import Any
 
+# Keyword sets per agent, checked in precedence order by quick_agent_help.
+# Tasks are matched word by word, so common inflections are listed too.
+_CATEGORY_KEYWORDS: list[tuple[frozenset[str], str]] = [
+    (frozenset(keywords.split()), sys.intern(agent))
+    for keywords, agent in [
+        (
+            "debug debugs debugged debugging fix fixes fixed fixing error errors"
+            " bug bugs buggy crash crashes crashed crashing"
+            " fail fails failed failing failure failures",
+            "debugger-agent",
+        ),
+        (
+            "code coding implement implements implemented implementing"
+            " implementation build builds building create creates creating"
+            " develop develops developing development",
+            "coding-agent",
+        ),
+        (
+            "test tests tested testing qa verify verifies verifying verification"
+            " validate validates validating validation",
+            "test-orchestrator-agent",
+        ),
+        (
+            "security secure audit audits auditing vulnerability vulnerabilities",
+            "security-auditor-agent",
+        ),
+        (
+            "ui frontend interface interfaces design designs",
+            "ui-specialist-agent",
+        ),
+        (
+            "deploy deploys deploying deployment infrastructure devops ci/cd",
+            "devops-agent",
+        ),
+        (
+            "document documents documenting documentation docs guide guides readme",
+            "documentation-agent",
+        ),
+        (
+            "research researching analyze analyzes analyzing analysis"
+            " investigate investigating investigation",
+            "deep-research-agent",
+        ),
+    ]
+]
+
+# Task type -> agent lookup used by get_agent_by_specialization
+_SPECIALIZATION_MAP: dict[str, str] = {
+    task_type: sys.intern(agent)
+    for task_type, agent in {
+        "debug": "debugger-agent",
+        "fix": "debugger-agent",
+        "troubleshoot": "debugger-agent",
+        "code": "coding-agent",
+        "implement": "coding-agent",
+        "develop": "coding-agent",
+        "test": "test-orchestrator-agent",
+        "qa": "test-orchestrator-agent",
+        "security": "security-auditor-agent",
+        "audit": "security-auditor-agent",
+        "docs": "documentation-agent",
+        "document": "documentation-agent",
+        "deploy": "devops-agent",
+        "infrastructure": "devops-agent",
+        "ui": "ui-specialist-agent",
+        "frontend": "ui-specialist-agent",
+        "design": "design-system-agent",
+        "architecture": "system-architect-agent",
+        "research": "deep-research-agent",
+        "analyze": "deep-research-agent",
+    }.items()
+}
+
+_TASK_TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+# Slash compound matched as a whole, since tokens split on "/"
+_CI_CD = "ci/cd"
+
+# Translation table stripping "@" mentions from agent names
+_STRIP_AT = str.maketrans("", "", "@")
+
 
 class AgentDelegator:
     """Helper class for direct agent delegation without Task tool limitations."""
 
-    AVAILABLE_AGENTS = [
-        "analytics-setup-agent",
-        "branding-agent",
-        "code-reviewer-agent",
-        "coding-agent",
-        "community-strategy-agent",
-        "compliance-scope-agent",
-        "core-concept-agent",
-        "creative-ideation-agent",
-        "debugger-agent",
-        "deep-research-agent",
-        "design-system-agent",
-        "devops-agent",
-        "documentation-agent",
-        "efficiency-optimization-agent",
-        "elicitation-agent",
-        "ethical-review-agent",
-        "health-monitor-agent",
-        "llm-ai-agents-research",
-        "marketing-strategy-orchestrator-agent",
-        "master-orchestrator-agent",
-        "ml-specialist-agent",
-        "performance-load-tester-agent",
-        "project-initiator-agent",
-        "prototyping-agent",
-        "root-cause-analysis-agent",
-        "security-auditor-agent",
-        "system-architect-agent",
-        "task-planning-agent",
-        "technology-advisor-agent",
-        "test-orchestrator-agent",
-        "uat-coordinator-agent",
-        "ui-specialist-agent",
-    ]
+    AVAILABLE_AGENTS = frozenset(
+        sys.intern(name)
+        for name in [
+            "analytics-setup-agent",
+            "branding-agent",
+            "code-reviewer-agent",
+            "coding-agent",
+            "community-strategy-agent",
+            "compliance-scope-agent",
+            "core-concept-agent",
+            "creative-ideation-agent",
+            "debugger-agent",
+            "deep-research-agent",
+            "design-system-agent",
+            "devops-agent",
+            "documentation-agent",
+            "efficiency-optimization-agent",
+            "elicitation-agent",
+            "ethical-review-agent",
+            "health-monitor-agent",
+            "llm-ai-agents-research",
+            "marketing-strategy-orchestrator-agent",
+            "master-orchestrator-agent",
+            "ml-specialist-agent",
+            "performance-load-tester-agent",
+            "project-initiator-agent",
+            "prototyping-agent",
+            "root-cause-analysis-agent",
+            "security-auditor-agent",
+            "system-architect-agent",
+            "task-planning-agent",
+            "technology-advisor-agent",
+            "test-orchestrator-agent",
+            "uat-coordinator-agent",
+            "ui-specialist-agent",
+        ]
+    )
 
     def __init__(self):
         self.current_agent = None
@@ -71,7 +157,7 @@ class AgentDelegator:
             return {
                 "success": False,
                 "error": f"Agent '{agent_name}' not available",
-                "available_agents": self.AVAILABLE_AGENTS,
+                "available_agents": sorted(self.AVAILABLE_AGENTS),
             }
 
         # For now, return instructions since we can't directly call MCP from here
@@ -84,6 +170,40 @@ class AgentDelegator:
             "note": "This bypasses the Task tool's master-orchestrator routing",
         }
 
+    def batch_delegate(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Delegate several tasks at once, validating all agent names in one pass.
+
+        Args:
+            pairs: List of (agent_name, context) tuples
+
+        Returns:
+            List of delegation result dicts in input order, or a single-item
+            list with the error if any agent name is unknown
+        """
+
+        invalid = {agent for agent, _ in pairs} - self.AVAILABLE_AGENTS
+        if invalid:
+            return [
+                {
+                    "success": False,
+                    "error": f"Agents not available: {', '.join(sorted(invalid))}",
+                    "available_agents": sorted(self.AVAILABLE_AGENTS),
+                }
+            ]
+
+        return [
+            {
+                "success": True,
+                "agent": agent,
+                "context": context,
+                "delegation_method": "direct_call",
+                "instruction": f"Use: mcp__agenthub_http__call_agent('{agent}')",
+                "note": "This bypasses the Task tool's master-orchestrator routing",
+            }
+            for agent, context in pairs
+        ]
+
     def get_agent_by_specialization(self, task_type: str) -> str | None:
         """
         Get the best agent for a specific task type.
@@ -95,30 +215,11 @@ class AgentDelegator:
             Agent name or None if no match
         """
 
-        specializations = {
-            "debug": "debugger-agent",
-            "fix": "debugger-agent",
-            "troubleshoot": "debugger-agent",
-            "code": "coding-agent",
-            "implement": "coding-agent",
-            "develop": "coding-agent",
-            "test": "test-orchestrator-agent",
-            "qa": "test-orchestrator-agent",
-            "security": "security-auditor-agent",
-            "audit": "security-auditor-agent",
-            "docs": "documentation-agent",
-            "document": "documentation-agent",
-            "deploy": "devops-agent",
-            "infrastructure": "devops-agent",
-            "ui": "ui-specialist-agent",
-            "frontend": "ui-specialist-agent",
-            "design": "design-system-agent",
-            "architecture": "system-architect-agent",
-            "research": "deep-research-agent",
-            "analyze": "deep-research-agent",
-        }
+        return _SPECIALIZATION_MAP.get(task_type.lower())
+
 
-        return specializations.get(task_type.lower())
+# Pre-joined agent list for call_direct_agent error messages
+_AVAILABLE_AGENTS_TEXT = ", ".join(sorted(AgentDelegator.AVAILABLE_AGENTS))
 
 
 # Convenience functions for direct use
@@ -128,6 +229,12 @@ def delegate_to_agent(agent_name: str, context: str = "") -> dict[str, Any]:
     return delegator.delegate_to_agent(agent_name, context)
 
 
+def batch_delegate(pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+    """Quick batch delegation function."""
+    delegator = AgentDelegator()
+    return delegator.batch_delegate(pairs)
+
+
 def get_agent_for_task(task_type: str) -> str | None:
     """Get best agent for task type."""
     delegator = AgentDelegator()
@@ -144,11 +251,23 @@ def call_direct_agent(agent_name: str) -> str:
     Returns:
         The MCP command string to call the agent directly
     """
-    # Remove @ prefix if present
-    clean_name = agent_name.replace("@", "").replace("-agent", "") + "-agent"
+    # Fast path: already a canonical agent name
+    if agent_name in AgentDelegator.AVAILABLE_AGENTS:
+        return f"mcp__agenthub_http__call_agent('{agent_name}')"
+
+    # Remove @ prefix if present and add the -agent suffix when missing
+    clean_name = agent_name.translate(_STRIP_AT)
+    if (
+        clean_name not in AgentDelegator.AVAILABLE_AGENTS
+        and not clean_name.endswith("-agent")
+    ):
+        clean_name += "-agent"
+    clean_name = sys.intern(clean_name)
     if clean_name not in AgentDelegator.AVAILABLE_AGENTS:
-        available = ", ".join(AgentDelegator.AVAILABLE_AGENTS)
-        return f"❌ ERROR: '{clean_name}' not found. Available: {available}"
+        return (
+            f"❌ ERROR: '{clean_name}' not found. "
+            f"Available: {_AVAILABLE_AGENTS_TEXT}"
+        )
 
     return f"mcp__agenthub_http__call_agent('{clean_name}')"
 
@@ -164,35 +283,16 @@ def quick_agent_help(task_description: str) -> str:
         Recommended agent and calling command
     """
     task_lower = task_description.lower()
+    tokens = set(_TASK_TOKEN_PATTERN.findall(task_lower))
+    if _CI_CD in task_lower:
+        tokens.add(_CI_CD)
 
     # Enhanced task type detection
-    if any(
-        word in task_lower for word in ["debug", "fix", "error", "bug", "crash", "fail"]
-    ):
-        agent = "debugger-agent"
-    elif any(
-        word in task_lower
-        for word in ["code", "implement", "build", "create", "develop"]
-    ):
-        agent = "coding-agent"
-    elif any(word in task_lower for word in ["test", "qa", "verify", "validate"]):
-        agent = "test-orchestrator-agent"
-    elif any(
-        word in task_lower for word in ["security", "audit", "vulnerability", "secure"]
-    ):
-        agent = "security-auditor-agent"
-    elif any(word in task_lower for word in ["ui", "frontend", "interface", "design"]):
-        agent = "ui-specialist-agent"
-    elif any(
-        word in task_lower for word in ["deploy", "infrastructure", "devops", "ci/cd"]
-    ):
-        agent = "devops-agent"
-    elif any(word in task_lower for word in ["document", "docs", "guide", "readme"]):
-        agent = "documentation-agent"
-    elif any(word in task_lower for word in ["research", "analyze", "investigate"]):
-        agent = "deep-research-agent"
-    else:
-        agent = "master-orchestrator-agent"
+    agent = "master-orchestrator-agent"
+    for keywords, candidate in _CATEGORY_KEYWORDS:
+        if not tokens.isdisjoint(keywords):
+            agent = candidate
+            break
 
     command = call_direct_agent(agent)
     return f"💡 Recommended: {agent}\n📞 Command: {command}"
@@ -4,8 +4,50 @@ Configuration validator for Claude Code hooks.
 Checks that all required configuration files exist before hook execution.
 """
 
+import os
 import sys
+from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
+from typing import NamedTuple
+
+_BANNER_RULE = "=" * 70
+
+_ERROR_HEADER = "\n".join(
+    [
+        "",
+        _BANNER_RULE,
+        "❌ CLAUDE CODE CONFIGURATION ERROR",
+        _BANNER_RULE,
+        "",
+        "The following required configuration files are missing:",
+    ]
+)
+
+_ERROR_FOOTER = "\n".join(
+    [
+        _BANNER_RULE,
+        "⚠️  CLAUDE CODE CANNOT START WITHOUT THESE FILES",
+        _BANNER_RULE,
+        "",
+        "Please follow the fix instructions above to create the missing files.",
+        "For complete setup instructions, run:",
+        "   python3 {claude_dir}/hooks/setup_hooks.py",
+        "",
+        "Need help? Check the documentation:",
+        "   cat {claude_dir}/README.md",
+        "",
+    ]
+)
+
+
+class _FileError(NamedTuple):
+    """A missing required configuration file."""
+
+    file: str
+    description: str
+    fix: str
+    purpose: str
 
 
 class ConfigurationValidator:
@@ -95,84 +137,96 @@ class ConfigurationValidator:
         # Last fallback
         return project_root
 
-    def validate(self) -> tuple[bool, list[dict]]:
+    def _scan_parent_dirs(self) -> dict[Path, set[str]]:
+        """
+        List each parent directory holding two or more required files once.
+
+        Returns:
+            Mapping of parent directory to the set of entry names it contains.
+            A missing parent maps to an empty set; single-file and unlistable
+            parents are omitted and checked individually.
+        """
+        by_parent = defaultdict(int)
+        for file_path in self.required_files:
+            by_parent[file_path.parent] += 1
+
+        listings = {}
+        for parent, count in by_parent.items():
+            if count < 2:
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                listings[parent] = set()
+            except OSError:
+                # Unlistable (e.g. permission denied); check files individually
+                continue
+
+        return listings
+
+    def validate(self) -> tuple[bool, list[_FileError]]:
         """
         Validate all required configuration files.
 
         Returns:
-            Tuple of (success: bool, errors: List[Dict])
-            Each error dict contains: file, description, fix, purpose
+            Tuple of (success: bool, errors: List[_FileError])
+            Each error carries: file, description, fix, purpose
         """
         errors = []
+        listings = self._scan_parent_dirs()
 
         for file_path, info in self.required_files.items():
-            if not file_path.exists():
+            existing = listings.get(file_path.parent)
+            if existing is not None:
+                found = file_path.name in existing
+            else:
+                found = file_path.exists()
+
+            if not found:
                 errors.append(
-                    {
-                        "file": str(file_path),
-                        "description": info["description"],
-                        "fix": info["fix"],
-                        "purpose": info["purpose"],
-                    }
+                    _FileError(
+                        str(file_path),
+                        info["description"],
+                        info["fix"],
+                        info["purpose"],
+                    )
                 )
 
         return len(errors) == 0, errors
 
-    def format_error_message(self, errors: list[dict]) -> str:
+    def format_error_message(self, errors: list[_FileError]) -> str:
         """
         Format validation errors into a clear error message.
 
         Args:
-            errors: List of error dictionaries
+            errors: List of missing-file errors from validate()
 
         Returns:
             Formatted error message string
         """
-        lines = [
-            "",
-            "=" * 70,
-            "❌ CLAUDE CODE CONFIGURATION ERROR",
-            "=" * 70,
-            "",
-            "The following required configuration files are missing:",
-            "",
-        ]
+        return "\n".join(self._iter_error_lines(errors))
+
+    def _iter_error_lines(self, errors: list[_FileError]) -> Iterator[str]:
+        """Yield the lines of the formatted error message."""
+        yield _ERROR_HEADER
+        yield ""
 
         for i, error in enumerate(errors, 1):
-            lines.extend(
-                [
-                    f"{i}. {error['description']}",
-                    f"   📁 Missing file: {error['file']}",
-                    f"   📝 Purpose: {error['purpose']}",
-                    "   ✅ To fix:",
-                    "",
-                ]
-            )
+            yield f"{i}. {error.description}"
+            yield f"   📁 Missing file: {error.file}"
+            yield f"   📝 Purpose: {error.purpose}"
+            yield "   ✅ To fix:"
+            yield ""
 
             # Add fix instructions with proper indentation
-            for line in error["fix"].split("\n"):
+            for line in error.fix.split("\n"):
                 if line.strip():
-                    lines.append(f"      {line}")
-
-            lines.append("")
-
-        lines.extend(
-            [
-                "=" * 70,
-                "⚠️  CLAUDE CODE CANNOT START WITHOUT THESE FILES",
-                "=" * 70,
-                "",
-                "Please follow the fix instructions above to create the missing files.",
-                "For complete setup instructions, run:",
-                f"   python3 {self.claude_dir}/hooks/setup_hooks.py",
-                "",
-                "Need help? Check the documentation:",
-                f"   cat {self.claude_dir}/README.md",
-                "",
-            ]
-        )
-
-        return "\n".join(lines)
+                    yield f"      {line}"
+
+            yield ""
+
+        yield _ERROR_FOOTER.format(claude_dir=self.claude_dir)
 
     def check_and_report(self) -> bool:
         """
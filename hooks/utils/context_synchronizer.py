@@ -10,13 +10,18 @@ Architecture Reference: Real-Time Context Injection System
 """
 
 import asyncio
+import atexit
+import itertools
 import json
 import logging
+import queue
 import time
-from dataclasses import asdict, dataclass
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from enum import Enum
-from threading import Lock
+from enum import Enum, IntEnum
+from operator import attrgetter
+from threading import Lock, Thread, Timer
 from typing import Any
 
 # Import cache manager
@@ -26,6 +31,20 @@ from .mcp_client import OptimizedMCPClient
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Broadcast log retention: trim to the last N entries past the size limit
+BROADCAST_LOG_KEEP = 50
+BROADCAST_LOG_MAX_BYTES = 64 * 1024
+
+# Background writer batching: flush after this many messages or this idle wait
+BROADCAST_WRITE_BATCH = 32
+BROADCAST_WRITE_WAIT_S = 0.05
+
+# Changes to the same context within this window (ns) are treated as conflicts
+_CONFLICT_WINDOW_NS = 5_000_000_000
+
+# Per-process sequence number for change IDs created in the same nanosecond
+_next_change_seq = itertools.count().__next__
+
 
 class ConflictResolutionStrategy(Enum):
     """Strategies for resolving context conflicts."""
@@ -36,7 +55,43 @@ class ConflictResolutionStrategy(Enum):
     PRIORITY_BASED = "priority_based"
 
 
-@dataclass
+class ContextType(IntEnum):
+    """Context levels, hashed as small ints; str() gives the lowercase label."""
+
+    TASK = 1
+    SUBTASK = 2
+    BRANCH = 3
+    PROJECT = 4
+    GLOBAL = 5
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+# Lowercase label -> ContextType, for normalizing incoming context types
+_CONTEXT_TYPES = {str(context_type): context_type for context_type in ContextType}
+
+# Cache TTL in seconds per context type
+_TTL_MAP = {
+    ContextType.TASK: 900,  # 15 minutes
+    ContextType.SUBTASK: 600,  # 10 minutes
+    ContextType.BRANCH: 1800,  # 30 minutes
+    ContextType.PROJECT: 3600,  # 1 hour
+    ContextType.GLOBAL: 7200,  # 2 hours
+}
+_DEFAULT_TTL = 900  # 15 minutes
+
+
+# Strategies that keep exactly one change per conflicting context
+_SINGLE_WINNER_STRATEGIES = frozenset(
+    {ConflictResolutionStrategy.LATEST_WINS, ConflictResolutionStrategy.PRIORITY_BASED}
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ContextChange:
     """Represents a context change event."""
 
@@ -44,14 +99,35 @@ class ContextChange:
     timestamp: float
     source: str  # pre_tool_hook, post_tool_hook, mcp_direct
     operation: str  # create, update, delete, sync
-    context_type: str  # task, branch, project, global
+    context_type: ContextType | str  # task, branch, project, global
     context_id: str
     changes: dict[str, Any]
     priority: int = 1  # 1-5, higher = more important
     requires_sync: bool = True
+    timestamp_ns: int = 0  # Derived from timestamp when not given
+    _cache_key: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Known labels become ContextType; unknown types stay plain strings
+        object.__setattr__(
+            self,
+            "context_type",
+            _CONTEXT_TYPES.get(self.context_type, self.context_type),
+        )
+        if not self.timestamp_ns:
+            object.__setattr__(self, "timestamp_ns", int(self.timestamp * 1e9))
+
+    @property
+    def cache_key(self) -> str:
+        """Shared cache key for this change's context, computed once."""
+        if self._cache_key is None:
+            object.__setattr__(
+                self, "_cache_key", f"{self.context_type}_{self.context_id}"
+            )
+        return self._cache_key
 
 
-@dataclass
+@dataclass(slots=True)
 class SynchronizationConfig:
     """Configuration for context synchronization."""
 
@@ -70,9 +146,12 @@ class ConflictResolver:
 
     def __init__(self, strategy: ConflictResolutionStrategy):
         self.strategy = strategy
-        self.resolution_history = []
+        # Keep only the last 100 resolutions
+        self.resolution_history: deque[dict] = deque(maxlen=100)
 
-    async def resolve_conflicts(self, conflicts: list[dict]) -> list[ContextChange]:
+    async def resolve_conflicts(
+        self, conflicts: list[ContextChange]
+    ) -> list[ContextChange]:
         """
         Resolve context conflicts using the configured strategy.
 
@@ -89,120 +168,122 @@ class ConflictResolver:
             f"Resolving {len(conflicts)} conflicts using strategy: {self.strategy.value}"
         )
 
+        conflict_groups = self._group_by_context(conflicts)
+
         if self.strategy == ConflictResolutionStrategy.LATEST_WINS:
-            return await self._resolve_latest_wins(conflicts)
+            return await self._resolve_latest_wins(conflict_groups)
         elif self.strategy == ConflictResolutionStrategy.MERGE_COMPATIBLE:
-            return await self._resolve_merge_compatible(conflicts)
+            return await self._resolve_merge_compatible(conflict_groups)
         elif self.strategy == ConflictResolutionStrategy.PRIORITY_BASED:
-            return await self._resolve_priority_based(conflicts)
+            return await self._resolve_priority_based(conflict_groups)
         else:  # MANUAL_REVIEW
-            return await self._resolve_manual_review(conflicts)
+            return await self._resolve_manual_review(conflict_groups)
 
-    async def _resolve_latest_wins(self, conflicts: list[dict]) -> list[ContextChange]:
-        """Resolve conflicts by taking the latest change."""
-        # Group conflicts by context_id
-        conflict_groups = {}
+    def _group_by_context(
+        self, conflicts: list[ContextChange]
+    ) -> dict[tuple, list[ContextChange]]:
+        """Group conflicts by their (context_type, context_id) key."""
+        conflict_groups = defaultdict(list)
         for conflict in conflicts:
-            context_key = f"{conflict['context_type']}:{conflict['context_id']}"
-            if context_key not in conflict_groups:
-                conflict_groups[context_key] = []
-            conflict_groups[context_key].append(conflict)
+            conflict_groups[(conflict.context_type, conflict.context_id)].append(
+                conflict
+            )
+        return conflict_groups
 
+    async def _resolve_latest_wins(
+        self, conflict_groups: dict[tuple, list[ContextChange]]
+    ) -> list[ContextChange]:
+        """Resolve conflicts by taking the latest change."""
+        resolved_at = datetime.now().isoformat()
         resolved_changes = []
         for context_key, group in conflict_groups.items():
-            # Sort by timestamp and take the latest
-            latest_conflict = sorted(group, key=lambda x: x["timestamp"], reverse=True)[
-                0
-            ]
-            resolved_changes.append(ContextChange(**latest_conflict))
+            # Take the latest change by timestamp
+            latest_conflict = max(group, key=lambda x: x.timestamp)
+            resolved_changes.append(latest_conflict)
 
             # Log resolution
-            self._log_resolution(
-                context_key, "latest_wins", len(group), latest_conflict["change_id"]
+            self.record_resolution(
+                context_key,
+                "latest_wins",
+                len(group),
+                latest_conflict.change_id,
+                resolved_at,
             )
 
         return resolved_changes
 
     async def _resolve_merge_compatible(
-        self, conflicts: list[dict]
+        self, conflict_groups: dict[tuple, list[ContextChange]]
     ) -> list[ContextChange]:
         """Resolve conflicts by merging compatible changes."""
-        # Group conflicts by context_id
-        conflict_groups = {}
-        for conflict in conflicts:
-            context_key = f"{conflict['context_type']}:{conflict['context_id']}"
-            if context_key not in conflict_groups:
-                conflict_groups[context_key] = []
-            conflict_groups[context_key].append(conflict)
-
+        resolved_at = datetime.now().isoformat()
         resolved_changes = []
         for context_key, group in conflict_groups.items():
             if len(group) == 1:
                 # No conflict, just apply the change
-                resolved_changes.append(ContextChange(**group[0]))
+                resolved_changes.append(group[0])
             else:
                 # Try to merge changes
                 merged_change = await self._merge_changes(group)
                 if merged_change:
                     resolved_changes.append(merged_change)
-                    self._log_resolution(
+                    self.record_resolution(
                         context_key,
                         "merge_compatible",
                         len(group),
                         merged_change.change_id,
+                        resolved_at,
                     )
                 else:
                     # Fall back to latest wins
-                    latest = sorted(group, key=lambda x: x["timestamp"], reverse=True)[
-                        0
-                    ]
-                    resolved_changes.append(ContextChange(**latest))
-                    self._log_resolution(
-                        context_key, "merge_fallback", len(group), latest["change_id"]
+                    latest = max(group, key=lambda x: x.timestamp)
+                    resolved_changes.append(latest)
+                    self.record_resolution(
+                        context_key,
+                        "merge_fallback",
+                        len(group),
+                        latest.change_id,
+                        resolved_at,
                     )
 
         return resolved_changes
 
     async def _resolve_priority_based(
-        self, conflicts: list[dict]
+        self, conflict_groups: dict[tuple, list[ContextChange]]
     ) -> list[ContextChange]:
         """Resolve conflicts based on priority levels."""
-        # Group conflicts by context_id
-        conflict_groups = {}
-        for conflict in conflicts:
-            context_key = f"{conflict['context_type']}:{conflict['context_id']}"
-            if context_key not in conflict_groups:
-                conflict_groups[context_key] = []
-            conflict_groups[context_key].append(conflict)
-
+        resolved_at = datetime.now().isoformat()
         resolved_changes = []
         for context_key, group in conflict_groups.items():
-            # Sort by priority (highest first), then by timestamp (latest first)
-            highest_priority = sorted(
-                group,
-                key=lambda x: (x.get("priority", 1), x["timestamp"]),
-                reverse=True,
-            )[0]
-
-            resolved_changes.append(ContextChange(**highest_priority))
-            self._log_resolution(
-                context_key, "priority_based", len(group), highest_priority["change_id"]
+            # Highest priority wins, latest timestamp breaks ties
+            highest_priority = max(group, key=lambda x: (x.priority, x.timestamp))
+
+            resolved_changes.append(highest_priority)
+            self.record_resolution(
+                context_key,
+                "priority_based",
+                len(group),
+                highest_priority.change_id,
+                resolved_at,
             )
 
         return resolved_changes
 
     async def _resolve_manual_review(
-        self, conflicts: list[dict]
+        self, conflict_groups: dict[tuple, list[ContextChange]]
     ) -> list[ContextChange]:
         """Mark conflicts for manual review (placeholder)."""
         # In a real implementation, this would queue conflicts for manual review
         # For now, we'll fall back to latest wins with logging
+        conflict_count = sum(len(group) for group in conflict_groups.values())
         logger.warning(
-            f"Manual review required for {len(conflicts)} conflicts - falling back to latest wins"
+            f"Manual review required for {conflict_count} conflicts - falling back to latest wins"
         )
-        return await self._resolve_latest_wins(conflicts)
+        return await self._resolve_latest_wins(conflict_groups)
 
-    async def _merge_changes(self, changes: list[dict]) -> ContextChange | None:
+    async def _merge_changes(
+        self, changes: list[ContextChange]
+    ) -> ContextChange | None:
         """
         Attempt to merge compatible changes.
 
@@ -212,52 +293,59 @@ class ConflictResolver:
             return None
 
         # Start with the earliest change as base
-        base_change = min(changes, key=lambda x: x["timestamp"])
-        merged_changes = base_change["changes"].copy()
+        ordered = sorted(changes, key=lambda x: x.timestamp)
+        base_change = ordered[0]
+        merged_changes = base_change.changes.copy()
+        claimed = set(merged_changes)
 
         # Try to merge subsequent changes
-        for change in changes:
-            if change == base_change:
-                continue
+        for change in ordered[1:]:
+            change_data = change.changes
 
-            change_data = change["changes"]
-
-            # Check for field conflicts
-            conflicting_fields = set(merged_changes.keys()) & set(change_data.keys())
-
-            if conflicting_fields:
+            # Check for field conflicts against keys merged so far
+            if not claimed.isdisjoint(change_data):
                 # Can't safely merge if there are field conflicts
                 logger.debug(
-                    f"Cannot merge changes due to conflicting fields: {conflicting_fields}"
+                    f"Cannot merge changes due to conflicting fields: {claimed.intersection(change_data)}"
                 )
                 return None
 
             # Merge non-conflicting fields
             merged_changes.update(change_data)
+            claimed.update(change_data)
 
         # Create merged change
+        now_ns = time.time_ns()
         return ContextChange(
-            change_id=f"merged_{int(time.time())}_{base_change['change_id'][:8]}",
-            timestamp=time.time(),
+            change_id=f"merged_{now_ns:x}_{base_change.change_id[:8]}",
+            timestamp=now_ns / 1e9,
+            timestamp_ns=now_ns,
             source="conflict_resolver",
             operation="update",
-            context_type=base_change["context_type"],
-            context_id=base_change["context_id"],
+            context_type=base_change.context_type,
+            context_id=base_change.context_id,
             changes=merged_changes,
-            priority=max(c.get("priority", 1) for c in changes),
+            priority=max(c.priority for c in changes),
         )
 
-    def _log_resolution(
+    def record_resolution(
         self,
-        context_key: str,
+        context_key: tuple,
         strategy: str,
         conflict_count: int,
         winning_change_id: str,
+        timestamp: str | None = None,
     ):
-        """Log conflict resolution for audit purposes."""
+        """
+        Record a conflict resolution in the audit history.
+
+        Also used by ContextSynchronizer for conflicts it settles while
+        coalescing a batch, so the history covers every resolution.
+        """
+        context_label = f"{context_key[0]}:{context_key[1]}"
         resolution_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "context_key": context_key,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "context_key": context_label,
             "strategy": strategy,
             "conflict_count": conflict_count,
             "winning_change_id": winning_change_id,
@@ -265,11 +353,7 @@ class ConflictResolver:
 
         self.resolution_history.append(resolution_entry)
 
-        # Keep only last 100 resolutions
-        if len(self.resolution_history) > 100:
-            self.resolution_history = self.resolution_history[-100:]
-
-        logger.info(f"Resolved conflict for {context_key} using {strategy}")
+        logger.info(f"Resolved conflict for {context_label} using {strategy}")
 
 
 class ContextSynchronizer:
@@ -281,12 +365,22 @@ class ContextSynchronizer:
         self.mcp_client = OptimizedMCPClient()
         self.conflict_resolver = ConflictResolver(self.config.conflict_resolution)
 
-        # Synchronization state
-        self.sync_lock = Lock()
-        self.pending_changes: list[ContextChange] = []
+        # Config is fixed after construction; serialize it once for stats
+        self._config_dict = asdict(self.config)
+
+        # Synchronization state (deque append/popleft are atomic, no lock needed)
+        self.pending_changes: deque[ContextChange] = deque(
+            maxlen=self.config.max_pending_changes
+        )
         self.change_subscribers: set[str] = set()
         self.last_sync_time = time.time()
 
+        # Broadcasts buffered until the batch interval elapses or the buffer fills
+        self._pending_broadcasts: list[ContextChange] = []
+        self._broadcast_timer: Timer | None = None
+        self._broadcast_lock = Lock()
+        self._flush_at_exit_registered = False
+
         # Performance tracking
         self.sync_stats = {
             "total_syncs": 0,
@@ -308,35 +402,37 @@ class ContextSynchronizer:
 
         try:
             async with asyncio.timeout(self.config.sync_timeout_ms / 1000):
-                # Step 1: Add to pending changes
-                with self.sync_lock:
-                    self.pending_changes.extend(changes)
-
-                    # Limit pending changes to prevent memory issues
-                    if len(self.pending_changes) > self.config.max_pending_changes:
-                        self.pending_changes = self.pending_changes[
-                            -self.config.max_pending_changes :
-                        ]
+                # Step 1: Add to pending changes (bounded by max_pending_changes)
+                self.pending_changes.extend(changes)
 
                 # Step 2: Detect and resolve conflicts
-                conflicts = self._detect_conflicts(changes)
-                if conflicts:
-                    logger.info(
-                        f"Detected {len(conflicts)} conflicts in context changes"
-                    )
-                    resolved_changes = await self.conflict_resolver.resolve_conflicts(
-                        conflicts
-                    )
-                    self.sync_stats["conflicts_resolved"] += len(conflicts)
+                if self.config.conflict_resolution in _SINGLE_WINNER_STRATEGIES:
+                    # Only one change per context survives, so fold the batch
+                    resolved_changes, contended = self._coalesce_batch(changes)
+                    if contended:
+                        logger.info(
+                            f"Coalesced {contended} conflicting context changes"
+                        )
+                        self.sync_stats["conflicts_resolved"] += contended
                 else:
-                    resolved_changes = changes
+                    conflicts = self._detect_conflicts(changes)
+                    if conflicts:
+                        logger.info(
+                            f"Detected {len(conflicts)} conflicts in context changes"
+                        )
+                        resolved_changes = (
+                            await self.conflict_resolver.resolve_conflicts(conflicts)
+                        )
+                        self.sync_stats["conflicts_resolved"] += len(conflicts)
+                    else:
+                        resolved_changes = changes
 
                 # Step 3: Apply changes to shared cache
                 await self._apply_changes_to_cache(resolved_changes)
 
-                # Step 4: Broadcast changes if enabled
+                # Step 4: Queue changes for the next batched broadcast if enabled
                 if self.config.enable_change_broadcast:
-                    await self._broadcast_context_updates(resolved_changes)
+                    self._queue_broadcast(resolved_changes)
 
                 # Step 5: Update statistics
                 sync_time_ms = (time.time() - start_time) * 1000
@@ -372,9 +468,11 @@ class ContextSynchronizer:
 
         This is a convenience method for creating and queuing context changes.
         """
+        now_ns = time.time_ns()
         change = ContextChange(
-            change_id=f"{source}_{int(time.time())}_{hash(str(changes)) % 10000:04d}",
-            timestamp=time.time(),
+            change_id=f"{source}_{now_ns:x}_{_next_change_seq():04x}",
+            timestamp=now_ns / 1e9,
+            timestamp_ns=now_ns,
             source=source,
             operation=operation,
             context_type=context_type,
@@ -383,8 +481,7 @@ class ContextSynchronizer:
             priority=priority,
         )
 
-        with self.sync_lock:
-            self.pending_changes.append(change)
+        self.pending_changes.append(change)
 
         logger.debug(f"Added context change: {change.change_id}")
         return change
@@ -398,79 +495,210 @@ class ContextSynchronizer:
         if not self.pending_changes:
             return True
 
-        with self.sync_lock:
-            changes_to_sync = self.pending_changes.copy()
-            self.pending_changes.clear()
+        changes_to_sync = []
+        pop_change = self.pending_changes.popleft
+        try:
+            while True:
+                changes_to_sync.append(pop_change())
+        except IndexError:
+            pass
 
         return await self.sync_context_changes(changes_to_sync)
 
-    def _detect_conflicts(self, changes: list[ContextChange]) -> list[dict]:
+    def _coalesce_batch(
+        self, changes: list[ContextChange]
+    ) -> tuple[list[ContextChange], int]:
+        """
+        Fold changes targeting the same context down to the strategy's winner.
+
+        Used for strategies that keep a single change per context. Changes to
+        a context spread over more than the conflict window are kept as-is.
+
+        Returns:
+            Tuple of (coalesced changes in first-seen order, contended count)
+        """
+        if len(changes) < 2:
+            return changes, 0
+
+        change_groups = defaultdict(list)
+        for change in changes:
+            change_groups[(change.context_type, change.context_id)].append(change)
+
+        # No two changes share a context
+        if len(change_groups) == len(changes):
+            return changes, 0
+
+        if self.config.conflict_resolution == ConflictResolutionStrategy.PRIORITY_BASED:
+            winner_key = attrgetter("priority", "timestamp")
+            strategy_label = "priority_based"
+        else:
+            winner_key = attrgetter("timestamp")
+            strategy_label = "latest_wins"
+
+        resolved_at = datetime.now().isoformat()
+        coalesced = []
+        contended = 0
+        for context_key, group in change_groups.items():
+            if len(group) == 1:
+                coalesced.append(group[0])
+                continue
+
+            time_span_ns = max(c.timestamp_ns for c in group) - min(
+                c.timestamp_ns for c in group
+            )
+            if time_span_ns > _CONFLICT_WINDOW_NS:
+                coalesced.extend(group)
+                continue
+
+            winner = max(group, key=winner_key)
+            coalesced.append(winner)
+            contended += len(group)
+
+            # Keep the resolver's audit trail for conflicts settled here
+            self.conflict_resolver.record_resolution(
+                context_key, strategy_label, len(group), winner.change_id, resolved_at
+            )
+
+        return coalesced, contended
+
+    def _detect_conflicts(self, changes: list[ContextChange]) -> list[ContextChange]:
         """
         Detect conflicts in context changes.
 
         Conflicts occur when multiple changes target the same context within
         a short time window.
         """
+        if len(changes) < 2:
+            return []
+
         conflicts = []
-        change_groups = {}
+        change_groups = defaultdict(list)
+        has_duplicates = False
 
         # Group changes by context
         for change in changes:
-            context_key = f"{change.context_type}:{change.context_id}"
-            if context_key not in change_groups:
-                change_groups[context_key] = []
-            change_groups[context_key].append(asdict(change))
+            group = change_groups[(change.context_type, change.context_id)]
+            if group:
+                has_duplicates = True
+            group.append(change)
+
+        # Nothing shares a context, so nothing can conflict
+        if not has_duplicates:
+            return []
 
         # Identify conflicts (multiple changes to same context)
         for context_key, group in change_groups.items():
             if len(group) > 1:
                 # Check if changes are close in time (within 5 seconds)
-                timestamps = [c["timestamp"] for c in group]
-                time_span = max(timestamps) - min(timestamps)
+                time_span_ns = max(c.timestamp_ns for c in group) - min(
+                    c.timestamp_ns for c in group
+                )
 
-                if time_span <= 5.0:  # 5 seconds window
+                if time_span_ns <= _CONFLICT_WINDOW_NS:
                     conflicts.extend(group)
                     logger.debug(
-                        f"Conflict detected for {context_key}: {len(group)} changes in {time_span:.2f}s"
+                        f"Conflict detected for {context_key[0]}:{context_key[1]}: {len(group)} changes in {time_span_ns / 1e9:.2f}s"
                     )
 
         return conflicts
 
     async def _apply_changes_to_cache(self, changes: list[ContextChange]) -> None:
-        """Apply resolved changes to the shared cache."""
+        """
+        Apply resolved changes to the shared cache.
+
+        Changes are folded per cache key locally first, so each touched key
+        costs one cache read and one write or delete, however many changes
+        in the batch target it.
+        """
+        now_iso = datetime.now().isoformat()
+        # cache_key -> (merged data, ttl), or None when the entry is deleted
+        staged: dict[str, tuple[dict, int] | None] = {}
+
         for change in changes:
             try:
-                cache_key = f"{change.context_type}_{change.context_id}"
+                cache_key = change.cache_key
 
                 if change.operation == "delete":
-                    self.cache.delete(cache_key)
-                    logger.debug(f"Deleted cache entry: {cache_key}")
+                    staged[cache_key] = None
+                    continue
+
+                # Get existing data, starting fresh if it isn't a dict
+                if cache_key in staged:
+                    entry = staged[cache_key]
+                    existing_data = entry[0] if entry is not None else {}
                 else:
-                    # Get existing cached data
-                    existing_data = self.cache.get(cache_key) or {}
+                    existing_data = self.cache.get(cache_key)
+                    if not isinstance(existing_data, dict):
+                        existing_data = {}
 
-                    # Apply changes
-                    if isinstance(existing_data, dict):
-                        existing_data.update(change.changes)
-                    else:
-                        existing_data = change.changes
+                # Apply changes and update timestamp
+                existing_data.update(change.changes)
+                existing_data["last_sync"] = now_iso
 
-                    # Update timestamp
-                    if isinstance(existing_data, dict):
-                        existing_data["last_sync"] = datetime.now().isoformat()
+                # Cache with appropriate TTL based on context type
+                ttl = _TTL_MAP.get(change.context_type, _DEFAULT_TTL)
+                staged[cache_key] = (existing_data, ttl)
 
-                    # Cache with appropriate TTL based on context type
-                    ttl = self._get_cache_ttl(change.context_type)
-                    self.cache.set(cache_key, existing_data, ttl)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to apply change {change.change_id} to cache: {e}"
+                )
 
+        for cache_key, entry in staged.items():
+            try:
+                if entry is None:
+                    self.cache.delete(cache_key)
+                    logger.debug(f"Deleted cache entry: {cache_key}")
+                else:
+                    self.cache.set(cache_key, *entry)
                     logger.debug(f"Updated cache entry: {cache_key}")
 
             except Exception as e:
-                logger.warning(
-                    f"Failed to apply change {change.change_id} to cache: {e}"
+                logger.warning(f"Failed to write cache entry {cache_key}: {e}")
+
+    def _queue_broadcast(self, changes: list[ContextChange]) -> None:
+        """
+        Buffer changes for a batched broadcast.
+
+        The buffer is flushed batch_sync_interval_ms after the first buffered
+        change, as soon as it holds max_pending_changes changes, or at exit.
+        """
+        if not changes:
+            return
+
+        with self._broadcast_lock:
+            self._pending_broadcasts.extend(changes)
+            buffer_full = (
+                len(self._pending_broadcasts) >= self.config.max_pending_changes
+            )
+            if not buffer_full and self._broadcast_timer is None:
+                if not self._flush_at_exit_registered:
+                    # Start the writer first so its atexit hook runs after ours
+                    _get_broadcast_queue()
+                    atexit.register(self.flush_broadcasts)
+                    self._flush_at_exit_registered = True
+                timer = Timer(
+                    self.config.batch_sync_interval_ms / 1000, self.flush_broadcasts
                 )
+                timer.daemon = True
+                timer.start()
+                self._broadcast_timer = timer
 
-    async def _broadcast_context_updates(self, changes: list[ContextChange]) -> None:
+        if buffer_full:
+            self.flush_broadcasts()
+
+    def flush_broadcasts(self) -> None:
+        """Broadcast all buffered changes now as a single update."""
+        with self._broadcast_lock:
+            pending_broadcasts = self._pending_broadcasts
+            self._pending_broadcasts = []
+            if self._broadcast_timer is not None:
+                self._broadcast_timer.cancel()
+                self._broadcast_timer = None
+
+        self._broadcast_context_updates(pending_broadcasts)
+
+    def _broadcast_context_updates(self, changes: list[ContextChange]) -> None:
         """
         Broadcast context updates to interested parties.
 
@@ -486,7 +714,7 @@ class ContextSynchronizer:
             "changes": [
                 {
                     "change_id": c.change_id,
-                    "context_type": c.context_type,
+                    "context_type": str(c.context_type),
                     "context_id": c.context_id,
                     "operation": c.operation,
                     "source": c.source,
@@ -498,43 +726,11 @@ class ContextSynchronizer:
         # Log broadcast (in a real system, this would send to subscribers)
         logger.info(f"Broadcasting {len(changes)} context updates")
 
-        # Store broadcast log for debugging
-        try:
-            from .env_loader import get_ai_data_path
+        # Serialize once; the same payload is shared by every consumer
+        payload = json.dumps(broadcast_message, separators=(",", ":"))
 
-            broadcast_log_path = get_ai_data_path() / "context_broadcasts.json"
-
-            if broadcast_log_path.exists():
-                with open(broadcast_log_path) as f:
-                    try:
-                        broadcast_data = json.load(f)
-                    except (json.JSONDecodeError, ValueError):
-                        broadcast_data = []
-            else:
-                broadcast_data = []
-
-            broadcast_data.append(broadcast_message)
-
-            # Keep only last 50 broadcasts
-            if len(broadcast_data) > 50:
-                broadcast_data = broadcast_data[-50:]
-
-            with open(broadcast_log_path, "w") as f:
-                json.dump(broadcast_data, f, indent=2)
-
-        except Exception as e:
-            logger.warning(f"Failed to log context broadcast: {e}")
-
-    def _get_cache_ttl(self, context_type: str) -> int:
-        """Get appropriate TTL for context type."""
-        ttl_map = {
-            "task": 900,  # 15 minutes
-            "subtask": 600,  # 10 minutes
-            "branch": 1800,  # 30 minutes
-            "project": 3600,  # 1 hour
-            "global": 7200,  # 2 hours
-        }
-        return ttl_map.get(context_type, 900)  # Default 15 minutes
+        # Store broadcast log for debugging, off the event loop
+        _get_broadcast_queue().put_nowait(payload)
 
     def _update_sync_stats(self, sync_time_ms: float, success: bool) -> None:
         """Update synchronization statistics."""
@@ -556,13 +752,14 @@ class ContextSynchronizer:
         total = self.sync_stats["total_syncs"]
         successful = self.sync_stats["successful_syncs"]
 
-        return {
-            **self.sync_stats,
-            "success_rate": successful / total if total > 0 else 0,
-            "last_sync_time": datetime.fromtimestamp(self.last_sync_time).isoformat(),
-            "pending_changes_count": len(self.pending_changes),
-            "config": asdict(self.config),
-        }
+        stats = self.sync_stats.copy()
+        stats["success_rate"] = successful / total if total > 0 else 0
+        stats["last_sync_time"] = datetime.fromtimestamp(
+            self.last_sync_time
+        ).isoformat()
+        stats["pending_changes_count"] = len(self.pending_changes)
+        stats["config"] = self._config_dict.copy()
+        return stats
 
 
 # Factory function and convenience wrappers
@@ -585,6 +782,113 @@ def get_global_synchronizer() -> ContextSynchronizer:
     return _global_synchronizer
 
 
+# Background event loop for syncing from inside an already-running loop
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the persistent background event loop, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(
+                target=loop.run_forever, name="context-sync-loop", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+# Reusable runner for syncing when no event loop is running; its loop can only
+# run one coroutine at a time, so callers on different threads take turns
+_runner: asyncio.Runner | None = None
+_runner_lock = Lock()
+
+
+def _run_on_shared_loop(coro):
+    """Run a coroutine on the shared runner, creating it on first use."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = asyncio.Runner()
+            atexit.register(_runner.close)
+        return _runner.run(coro)
+
+
+# Background writer for the context broadcast log
+_broadcast_queue: queue.Queue | None = None
+_broadcast_writer: Thread | None = None
+_broadcast_writer_lock = Lock()
+
+
+def _get_broadcast_queue() -> queue.Queue:
+    """Get the broadcast log queue, starting the writer thread on first use."""
+    global _broadcast_queue, _broadcast_writer
+    with _broadcast_writer_lock:
+        if _broadcast_queue is None:
+            _broadcast_queue = queue.Queue()
+            _broadcast_writer = Thread(
+                target=_run_broadcast_writer,
+                args=(_broadcast_queue,),
+                name="context-broadcast-writer",
+                daemon=True,
+            )
+            _broadcast_writer.start()
+            atexit.register(_stop_broadcast_writer)
+    return _broadcast_queue
+
+
+def _run_broadcast_writer(messages: queue.Queue) -> None:
+    """Drain queued broadcast messages and append them to the log in batches."""
+    running = True
+    while running:
+        batch = [messages.get()]
+        while len(batch) < BROADCAST_WRITE_BATCH:
+            try:
+                batch.append(messages.get(timeout=BROADCAST_WRITE_WAIT_S))
+            except queue.Empty:
+                break
+
+        # None is the shutdown sentinel; write what came before it
+        if None in batch:
+            batch = batch[: batch.index(None)]
+            running = False
+
+        if batch:
+            _write_broadcast_log(batch)
+
+
+def _write_broadcast_log(batch: list[str]) -> None:
+    """Append serialized broadcasts as JSON lines, trimming an oversized log."""
+    try:
+        from .env_loader import get_ai_data_path
+
+        broadcast_log_path = get_ai_data_path() / "context_broadcasts.jsonl"
+
+        # Append one JSON line per broadcast; no read-modify-write
+        with open(broadcast_log_path, "a") as f:
+            f.write("".join(payload + "\n" for payload in batch))
+            log_size = f.tell()
+
+        # Trim to the last entries only once the log has grown large
+        if log_size > BROADCAST_LOG_MAX_BYTES:
+            with open(broadcast_log_path) as f:
+                recent = deque(f, maxlen=BROADCAST_LOG_KEEP)
+            with open(broadcast_log_path, "w") as f:
+                f.writelines(recent)
+
+    except Exception as e:
+        logger.warning(f"Failed to log context broadcast: {e}")
+
+
+def _stop_broadcast_writer() -> None:
+    """Flush pending broadcast messages before the interpreter exits."""
+    if _broadcast_queue is not None and _broadcast_writer is not None:
+        _broadcast_queue.put(None)
+        _broadcast_writer.join(timeout=1.0)
+
+
 def sync_context_change(
     source: str,
     operation: str,
@@ -614,18 +918,18 @@ def sync_context_change(
         # Sync immediately if real-time sync is enabled
         if synchronizer.config.enable_real_time_sync:
             try:
-                loop = asyncio.get_running_loop()
-                # If already in an event loop, create a new one in a thread
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, synchronizer.sync_context_changes([change])
-                    )
-                    return future.result(timeout=2.0)
+                asyncio.get_running_loop()
+                # If already in an event loop, run on the background loop thread
+                future = asyncio.run_coroutine_threadsafe(
+                    synchronizer.sync_context_changes([change]),
+                    _get_background_loop(),
+                )
+                return future.result(timeout=2.0)
             except RuntimeError:
-                # No event loop is running, create a new one
-                return asyncio.run(synchronizer.sync_context_changes([change]))
+                # No event loop is running, reuse the shared runner's loop
+                return _run_on_shared_loop(
+                    synchronizer.sync_context_changes([change])
+                )
         else:
             return True  # Change queued for later sync
 
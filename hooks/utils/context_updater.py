@@ -10,13 +10,19 @@ Architecture Reference: Real-Time Context Injection System
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import os
+import queue
 import re
 import time
+from collections import defaultdict, deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from threading import Lock, Thread
 from typing import Any
 
 from .cache_manager import SessionContextCache
@@ -27,6 +33,67 @@ from .mcp_client import OptimizedMCPClient
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Audit log retention: entries kept after a trim, and size that triggers one
+AUDIT_LOG_KEEP = 200
+AUDIT_LOG_MAX_BYTES = 256 * 1024
+
+# Background audit writer: bounded queue, lines per write, wait for more lines
+AUDIT_QUEUE_MAX = 1000
+AUDIT_WRITE_BATCH = 32
+AUDIT_WRITE_WAIT_S = 0.05
+
+# Source file extensions whose edits may need a documentation check
+_DOC_CHECK_EXTS = frozenset({".py", ".js", ".ts", ".sh", ".sql"})
+
+# A regex body made only of literal characters and escaped metacharacters;
+# other escapes such as \d or \w are character classes, not literals
+_LITERAL_BODY = re.compile(r"(?:[^\\.^$*+?{}\[\]|()]|\\[\\.^$*+?{}\[\]|()/-])*")
+_UNESCAPE = re.compile(r"\\(.)")
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format an epoch-nanosecond timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+def _build_matcher(patterns: list[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate for a list of regex patterns.
+
+    Patterns shaped like ``.*LITERAL$`` become ``str.endswith`` checks and
+    ``.*LITERAL.*`` become substring checks; anything else is compiled into
+    a single regex alternation.
+    """
+    suffixes: list[str] = []
+    substrings: list[str] = []
+    regexes: list[str] = []
+
+    for p in patterns:
+        body = p[2:] if p.startswith(".*") else None
+        if body is not None and body.endswith("$"):
+            kind, body = suffixes, body[:-1]
+        elif body is not None and body.endswith(".*"):
+            kind, body = substrings, body[:-2]
+        else:
+            kind = None
+
+        if kind is not None and body and _LITERAL_BODY.fullmatch(body):
+            kind.append(_UNESCAPE.sub(r"\1", body))
+        else:
+            regexes.append(p)
+
+    suffix_tuple = tuple(suffixes)
+    regex = re.compile("|".join(f"(?:{p})" for p in regexes)) if regexes else None
+
+    def match(value: str) -> bool:
+        if suffix_tuple and value.endswith(suffix_tuple):
+            return True
+        if any(needle in value for needle in substrings):
+            return True
+        return regex is not None and regex.search(value) is not None
+
+    return match
+
 
 @dataclass
 class ContextUpdateConfig:
@@ -39,9 +106,44 @@ class ContextUpdateConfig:
     audit_trail_enabled: bool = True
 
 
+def _build_operation_matcher(pattern: dict) -> Callable[[dict], bool]:
+    """
+    Build a tool-input predicate performing only the checks a pattern uses.
+
+    The tool name is not checked here; the classifier only consults matchers
+    registered for the incoming tool.
+    """
+    checks: list[Callable[[dict], bool]] = []
+
+    if "actions" in pattern:
+        actions = tuple(pattern["actions"])
+        checks.append(lambda tool_input: tool_input.get("action", "") in actions)
+
+    if "patterns" in pattern:
+        command_match = _build_matcher(pattern["patterns"])
+        checks.append(lambda tool_input: command_match(tool_input.get("command", "")))
+
+    if "file_patterns" in pattern:
+        path_match = _build_matcher(pattern["file_patterns"])
+        checks.append(lambda tool_input: path_match(tool_input.get("file_path", "")))
+
+    if "indicators" in pattern:
+        indicators = tuple(pattern["indicators"])
+        checks.append(lambda tool_input: all(k in tool_input for k in indicators))
+
+    if not checks:
+        return lambda tool_input: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda tool_input: all(check(tool_input) for check in checks)
+
+
 class OperationClassifier:
     """Classifies tool operations to determine context update requirements."""
 
+    # Every Bash pattern needs one of these words; most commands contain none
+    _BASH_KEYWORDS = ("rm", "del", "git")
+
     def __init__(self):
         self.operation_patterns = {
             "file_created": {
@@ -56,7 +158,7 @@ class OperationClassifier:
             },
             "file_deleted": {
                 "tools": ["Bash"],
-                "patterns": [r"rm\s+.*", r"del\s+.*"],
+                "patterns": [r"\b(?:rm|del)\s+"],
                 "priority": "high",
             },
             "task_created": {
@@ -81,12 +183,7 @@ class OperationClassifier:
             },
             "git_operation": {
                 "tools": ["Bash"],
-                "patterns": [
-                    r"git\s+add.*",
-                    r"git\s+commit.*",
-                    r"git\s+push.*",
-                    r"git\s+branch.*",
-                ],
+                "patterns": [r"git\s+(?:add|commit|push|branch)"],
                 "priority": "medium",
             },
             "documentation_updated": {
@@ -96,88 +193,80 @@ class OperationClassifier:
             },
         }
 
+        # Specialize each pattern into a matcher once, then index the matchers
+        # by tool name, preserving their declaration order
+        by_tool: defaultdict[str, list[tuple[str, str, Callable]]] = defaultdict(list)
+        for operation_type, pattern in self.operation_patterns.items():
+            entry = (
+                operation_type,
+                pattern.get("priority", "low"),
+                _build_operation_matcher(pattern),
+            )
+            for tool in pattern["tools"]:
+                by_tool[tool].append(entry)
+        self._by_tool = dict(by_tool)
+        self._known_tools = frozenset(by_tool)
+
     def classify_operation(
         self,
         tool_name: str,
         tool_input: dict[str, Any],
         tool_output: dict | None = None,
+        timestamp_ns: int | None = None,
     ) -> tuple[str, str, dict]:
         """
         Classify tool operation to determine update requirements.
 
+        ``timestamp_ns`` is the hook event time in epoch nanoseconds; it
+        defaults to now.
+
         Returns:
             (operation_type, priority, update_requirements)
         """
-        # Check each operation pattern
-        for operation_type, pattern in self.operation_patterns.items():
-            if self._matches_pattern(tool_name, tool_input, tool_output, pattern):
-                priority = pattern.get("priority", "low")
+        # Most tools (Read, Grep, Glob, ...) never trigger an update
+        if tool_name not in self._known_tools:
+            return "unknown", "none", {}
+
+        # Skip the Bash regexes for commands like ls, cat or grep
+        if tool_name == "Bash":
+            command = tool_input.get("command", "")
+            if not any(word in command for word in self._BASH_KEYWORDS):
+                return "unknown", "none", {}
+
+        # Check only the operation patterns registered for this tool
+        for operation_type, priority, matches in self._by_tool[tool_name]:
+            if matches(tool_input):
                 update_reqs = self._get_update_requirements(
-                    operation_type, tool_name, tool_input, tool_output
+                    operation_type, tool_name, tool_input, tool_output, timestamp_ns
                 )
                 return operation_type, priority, update_reqs
 
         return "unknown", "none", {}
 
-    def _matches_pattern(
-        self, tool_name: str, tool_input: dict, tool_output: dict | None, pattern: dict
-    ) -> bool:
-        """Check if operation matches a specific pattern."""
-
-        # Check tool name match
-        if "tools" in pattern:
-            if tool_name not in pattern["tools"]:
-                return False
-
-        # Check action match for MCP tools
-        if "actions" in pattern:
-            action = tool_input.get("action", "")
-            if action not in pattern["actions"]:
-                return False
-
-        # Check regex patterns for bash commands
-        if "patterns" in pattern:
-            command = tool_input.get("command", "")
-            if not any(re.search(p, command) for p in pattern["patterns"]):
-                return False
-
-        # Check file pattern matches
-        if "file_patterns" in pattern:
-            file_path = tool_input.get("file_path", "")
-            if not any(re.search(p, file_path) for p in pattern["file_patterns"]):
-                return False
-
-        # Check required indicators
-        if "indicators" in pattern:
-            if not all(indicator in tool_input for indicator in pattern["indicators"]):
-                return False
-
-        return True
-
     def _get_update_requirements(
         self,
         operation_type: str,
         tool_name: str,
         tool_input: dict,
         tool_output: dict | None,
+        timestamp_ns: int | None = None,
     ) -> dict:
         """Get specific update requirements for operation type."""
 
         base_requirements = {
             "operation_type": operation_type,
             "tool_name": tool_name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": timestamp_ns or time.time_ns(),
         }
 
         if operation_type in ["file_created", "file_modified"]:
             file_path = tool_input.get("file_path", "")
+            file_extension = os.path.splitext(file_path)[1]
             base_requirements.update(
                 {
                     "file_path": file_path,
-                    "file_extension": Path(file_path).suffix if file_path else "",
-                    "needs_documentation_check": file_path.endswith(
-                        (".py", ".js", ".ts", ".sh", ".sql")
-                    ),
+                    "file_extension": file_extension,
+                    "needs_documentation_check": file_extension in _DOC_CHECK_EXTS,
                 }
             )
 
@@ -228,10 +317,40 @@ class OperationClassifier:
 class MCPContextUpdater:
     """Handles MCP context updates with async support and error handling."""
 
+    # Cache key templates invalidated for each kind of change
+    _FILE_CACHE_KEYS = (
+        "file_context_{name}",
+        "file_tasks_{path}",
+        "documentation_{path}",
+    )
+    _TASK_CACHE_KEYS = (
+        "task_{task_id}",
+        "task_context_{task_id}",
+        "pending_tasks",
+        "next_task_{task_id}",
+    )
+    _CONTEXT_CACHE_KEYS = (
+        "context_{level}_{context_id}",
+        "hierarchy_{context_id}",
+        "{level}_context_{context_id}",
+    )
+
     def __init__(self, config: ContextUpdateConfig):
         self.config = config
-        self.mcp_client = OptimizedMCPClient()
-        self.cache = SessionContextCache()
+        self.mcp_client = get_shared_mcp_client()
+        self.cache = get_shared_cache()
+
+        # Operation type -> handler coroutine
+        self._dispatch = {
+            "file_created": self._handle_file_operation_update,
+            "file_modified": self._handle_file_operation_update,
+            "task_created": self._handle_task_update,
+            "task_updated": self._handle_task_update,
+            "subtask_updated": self._handle_subtask_update,
+            "context_updated": self._handle_context_update,
+            "git_operation": self._handle_git_update,
+            "documentation_updated": self._handle_documentation_update,
+        }
 
     async def update_context(self, update_requirements: dict) -> bool:
         """
@@ -240,26 +359,14 @@ class MCPContextUpdater:
         Returns True if update was successful, False otherwise.
         """
         operation_type = update_requirements.get("operation_type")
+        handler = self._dispatch.get(operation_type)
 
-        try:
-            if operation_type in ["file_created", "file_modified"]:
-                return await self._handle_file_operation_update(update_requirements)
-            elif operation_type in ["task_created", "task_updated"]:
-                return await self._handle_task_update(update_requirements)
-            elif operation_type == "subtask_updated":
-                return await self._handle_subtask_update(update_requirements)
-            elif operation_type == "context_updated":
-                return await self._handle_context_update(update_requirements)
-            elif operation_type == "git_operation":
-                return await self._handle_git_update(update_requirements)
-            elif operation_type == "documentation_updated":
-                return await self._handle_documentation_update(update_requirements)
-            else:
-                logger.debug(
-                    f"No specific handler for operation type: {operation_type}"
-                )
-                return True
+        if handler is None:
+            logger.debug(f"No specific handler for operation type: {operation_type}")
+            return True
 
+        try:
+            return await handler(update_requirements)
         except Exception as e:
             logger.error(f"Failed to update context for {operation_type}: {e}")
             return False
@@ -269,15 +376,24 @@ class MCPContextUpdater:
         file_path = requirements.get("file_path", "")
 
         # Check if file has associated tasks
-        related_tasks = await self._find_tasks_mentioning_file(file_path)
+        related_tasks = await self._find_tasks_mentioning_file(file_path, limit=3)
 
         if related_tasks:
-            # Update task context with file modification info
-            for task in related_tasks[:3]:  # Limit to 3 most relevant tasks
-                task_id = task.get("id")
-                if task_id:
-                    await self._add_task_progress(
-                        task_id, f"Modified file: {file_path}"
+            # Update task context with file modification info, concurrently
+            progress_note = f"Modified file: {file_path}"
+            task_ids = [
+                task["id"]
+                for task in related_tasks[:3]  # In case the server ignores limit
+                if task.get("id")
+            ]
+            results = await asyncio.gather(
+                *(self._add_task_progress(tid, progress_note) for tid in task_ids),
+                return_exceptions=True,
+            )
+            for task_id, result in zip(task_ids, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"Failed to add progress to task {task_id}: {result}"
                     )
 
         # Invalidate file-related cache entries
@@ -370,7 +486,7 @@ class MCPContextUpdater:
         """Handle special processing when a task is completed."""
         try:
             # Get task details
-            result = self.mcp_client.make_request(
+            result = await self.mcp_client.make_request_async(
                 "/mcp/manage_task", {"action": "get", "task_id": task_id}
             )
 
@@ -378,7 +494,10 @@ class MCPContextUpdater:
                 task = result.get("data", {}).get("task", {})
 
                 # Add completion insight to context
-                completion_insight = f"Task completed: {task.get('title', 'Unknown')} on {datetime.now().isoformat()}"
+                completed_at = _iso_from_ns(
+                    requirements.get("timestamp_ns") or time.time_ns()
+                )
+                completion_insight = f"Task completed: {task.get('title', 'Unknown')} on {completed_at}"
 
                 git_branch_id = task.get("git_branch_id")
                 if git_branch_id:
@@ -393,11 +512,14 @@ class MCPContextUpdater:
 
         return False
 
-    async def _find_tasks_mentioning_file(self, file_path: str) -> list[dict]:
-        """Find tasks that mention a specific file."""
+    async def _find_tasks_mentioning_file(
+        self, file_path: str, limit: int = 3
+    ) -> list[dict]:
+        """Find up to ``limit`` tasks that mention a specific file."""
         try:
-            result = self.mcp_client.make_request(
-                "/mcp/manage_task", {"action": "search", "query": file_path, "limit": 5}
+            result = await self.mcp_client.make_request_async(
+                "/mcp/manage_task",
+                {"action": "search", "query": file_path, "limit": limit},
             )
 
             if result and result.get("success"):
@@ -410,7 +532,7 @@ class MCPContextUpdater:
     async def _add_task_progress(self, task_id: str, progress_note: str) -> bool:
         """Add progress note to a task."""
         try:
-            result = self.mcp_client.make_request(
+            result = await self.mcp_client.make_request_async(
                 "/mcp/manage_context",
                 {
                     "action": "add_progress",
@@ -431,7 +553,7 @@ class MCPContextUpdater:
     ) -> bool:
         """Add insight to branch context."""
         try:
-            result = self.mcp_client.make_request(
+            result = await self.mcp_client.make_request_async(
                 "/mcp/manage_context",
                 {
                     "action": "add_insight",
@@ -483,39 +605,36 @@ class MCPContextUpdater:
             )
             return False
 
+    def _delete_cache_keys(self, keys: list[str]):
+        """Delete several cache keys, in one call when the cache supports it."""
+        delete_many = getattr(self.cache, "delete_many", None)
+        if delete_many is not None:
+            delete_many(keys)
+        else:
+            for key in keys:
+                self.cache.delete(key)
+
     def _invalidate_file_cache(self, file_path: str):
         """Invalidate cache entries related to a file."""
-        cache_keys_to_invalidate = [
-            f"file_context_{Path(file_path).name}",
-            f"file_tasks_{file_path}",
-            f"documentation_{file_path}",
-        ]
-
-        for key in cache_keys_to_invalidate:
-            self.cache.delete(key)
+        name = os.path.basename(file_path)
+        self._delete_cache_keys(
+            [t.format(name=name, path=file_path) for t in self._FILE_CACHE_KEYS]
+        )
 
     def _invalidate_task_cache(self, task_id: str):
         """Invalidate cache entries related to a task."""
-        cache_keys_to_invalidate = [
-            f"task_{task_id}",
-            f"task_context_{task_id}",
-            "pending_tasks",
-            f"next_task_{task_id}",
-        ]
-
-        for key in cache_keys_to_invalidate:
-            self.cache.delete(key)
+        self._delete_cache_keys(
+            [t.format(task_id=task_id) for t in self._TASK_CACHE_KEYS]
+        )
 
     def _invalidate_context_cache(self, context_id: str, level: str):
         """Invalidate cache entries related to context."""
-        cache_keys_to_invalidate = [
-            f"context_{level}_{context_id}",
-            f"hierarchy_{context_id}",
-            f"{level}_context_{context_id}",
-        ]
-
-        for key in cache_keys_to_invalidate:
-            self.cache.delete(key)
+        self._delete_cache_keys(
+            [
+                t.format(level=level, context_id=context_id)
+                for t in self._CONTEXT_CACHE_KEYS
+            ]
+        )
 
 
 class ContextUpdater:
@@ -538,11 +657,13 @@ class ContextUpdater:
         Returns True if update was successful or not needed, False on error.
         """
         start_time = time.time()
+        # One timestamp for the whole event, reused by handlers and the audit
+        timestamp_ns = time.time_ns()
 
         try:
             # Step 1: Classify operation (< 10ms)
             operation_type, priority, update_reqs = self.classifier.classify_operation(
-                tool_name, tool_input, tool_output
+                tool_name, tool_input, tool_output, timestamp_ns
             )
 
             if operation_type == "unknown" or priority == "none":
@@ -584,12 +705,10 @@ class ContextUpdater:
     def _create_audit_entry(
         self, tool_name: str, operation_type: str, success: bool, requirements: dict
     ):
-        """Create audit trail entry for context updates."""
+        """Queue an audit trail entry for the background log writer."""
         try:
-            from .env_loader import get_ai_data_path
-
             audit_entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": requirements["timestamp_ns"],
                 "tool_name": tool_name,
                 "operation_type": operation_type,
                 "success": success,
@@ -598,27 +717,10 @@ class ContextUpdater:
                 },  # Exclude large output
             }
 
-            audit_log_path = get_ai_data_path() / "context_updates_audit.json"
-
-            # Read existing audit data
-            if audit_log_path.exists():
-                with open(audit_log_path) as f:
-                    try:
-                        audit_data = json.load(f)
-                    except (json.JSONDecodeError, ValueError):
-                        audit_data = []
-            else:
-                audit_data = []
-
-            audit_data.append(audit_entry)
-
-            # Keep only last 200 entries
-            if len(audit_data) > 200:
-                audit_data = audit_data[-200:]
-
-            with open(audit_log_path, "w") as f:
-                json.dump(audit_data, f, indent=2)
+            _get_audit_queue().put_nowait(audit_entry)
 
+        except queue.Full:
+            logger.warning("Audit queue full, dropping context update audit entry")
         except Exception as e:
             logger.warning(f"Failed to create audit entry: {e}")
 
@@ -629,6 +731,166 @@ def create_context_updater(config: ContextUpdateConfig | None = None) -> Context
     return ContextUpdater(config)
 
 
+# Shared MCP client and cache, so pooled connections survive across updates
+_shared_mcp_client: OptimizedMCPClient | None = None
+_shared_cache: SessionContextCache | None = None
+
+
+def get_shared_mcp_client() -> OptimizedMCPClient:
+    """Get the MCP client shared by all context updaters."""
+    global _shared_mcp_client
+    if _shared_mcp_client is None:
+        _shared_mcp_client = OptimizedMCPClient()
+    return _shared_mcp_client
+
+
+def get_shared_cache() -> SessionContextCache:
+    """Get the session cache shared by all context updaters."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SessionContextCache()
+    return _shared_cache
+
+
+# Global updater instance for hook usage
+_global_updater: ContextUpdater | None = None
+
+
+def get_global_updater() -> ContextUpdater:
+    """Get the global context updater instance."""
+    global _global_updater
+    if _global_updater is None:
+        _global_updater = create_context_updater()
+    return _global_updater
+
+
+# Background event loop for updating from inside an already-running loop
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the persistent background event loop, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(
+                target=loop.run_forever, name="context-update-loop", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+# Background writer for the context update audit log
+_audit_queue: queue.Queue | None = None
+_audit_writer: Thread | None = None
+_audit_writer_lock = Lock()
+
+
+def _get_audit_queue() -> queue.Queue:
+    """Get the audit log queue, starting the writer thread on first use."""
+    global _audit_queue, _audit_writer
+    with _audit_writer_lock:
+        if _audit_queue is None:
+            _audit_queue = queue.Queue(maxsize=AUDIT_QUEUE_MAX)
+            _audit_writer = Thread(
+                target=_run_audit_writer,
+                args=(_audit_queue,),
+                name="context-audit-writer",
+                daemon=True,
+            )
+            _audit_writer.start()
+            atexit.register(_stop_audit_writer)
+    return _audit_queue
+
+
+def _run_audit_writer(entries: queue.Queue) -> None:
+    """Drain queued audit entries and append them to the log in batches."""
+    running = True
+    while running:
+        batch = [entries.get()]
+        while len(batch) < AUDIT_WRITE_BATCH:
+            try:
+                batch.append(entries.get(timeout=AUDIT_WRITE_WAIT_S))
+            except queue.Empty:
+                break
+
+        # None is the shutdown sentinel; write what came before it
+        if None in batch:
+            batch = batch[: batch.index(None)]
+            running = False
+
+        if batch:
+            _write_audit_log(batch)
+
+
+# Audit log location, resolved once by the writer thread
+_audit_log_path: Path | None = None
+
+
+def _get_audit_log_path() -> Path:
+    """Get the audit log path, importing env_loader only on first use."""
+    global _audit_log_path
+    if _audit_log_path is None:
+        from .env_loader import get_ai_data_path
+
+        _audit_log_path = get_ai_data_path() / "context_updates_audit.jsonl"
+    return _audit_log_path
+
+
+def _format_audit_line(entry: dict) -> str | None:
+    """Serialize one audit entry as a JSON line, or None if it can't be encoded."""
+    # The ISO timestamp is only formatted here, off the hook's path;
+    # compact separators keep lines small and stdlib encoding fast
+    timestamp = _iso_from_ns(entry.pop("timestamp_ns"))
+    try:
+        # default=str covers values such as Path or datetime in tool_input
+        return (
+            json.dumps(
+                {"timestamp": timestamp, **entry}, separators=(",", ":"), default=str
+            )
+            + "\n"
+        )
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Skipping unserializable context update audit entry: {e}")
+        return None
+
+
+def _write_audit_log(batch: list[dict]) -> None:
+    """Append audit entries as JSON lines, trimming an oversized log."""
+    try:
+        audit_log_path = _get_audit_log_path()
+
+        # Serialize entries one by one so a bad entry doesn't drop the batch
+        lines = [line for line in map(_format_audit_line, batch) if line is not None]
+        if not lines:
+            return
+
+        # Append one JSON line per entry; no read-modify-write
+        with open(audit_log_path, "a") as f:
+            f.write("".join(lines))
+            log_size = f.tell()
+
+        # Trim to the last entries only once the log has grown large
+        if log_size > AUDIT_LOG_MAX_BYTES:
+            with open(audit_log_path) as f:
+                recent = deque(f, maxlen=AUDIT_LOG_KEEP)
+            with open(audit_log_path, "w") as f:
+                f.writelines(recent)
+
+    except Exception as e:
+        logger.warning(f"Failed to write context update audit log: {e}")
+
+
+def _stop_audit_writer() -> None:
+    """Flush pending audit entries before the interpreter exits."""
+    if _audit_queue is not None and _audit_writer is not None:
+        # Blocking put: the sentinel must not be dropped on a full queue
+        _audit_queue.put(None)
+        _audit_writer.join(timeout=1.0)
+
+
 # Synchronous wrapper for use in existing hook infrastructure
 def update_context_sync(
     tool_name: str, tool_input: dict[str, Any], tool_output: dict | None = None
@@ -639,22 +901,19 @@ def update_context_sync(
     This function provides a synchronous interface for the existing hook system
     while internally using async operations for better performance.
     """
-    updater = create_context_updater()
+    updater = get_global_updater()
 
     # Run async operation in event loop
     try:
         # Check if we're already in an async event loop
         try:
-            loop = asyncio.get_running_loop()
-            # If already in an event loop, create a new one in a thread
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    updater.update_context(tool_name, tool_input, tool_output),
-                )
-                return future.result(timeout=2.0)  # 2 second timeout
+            asyncio.get_running_loop()
+            # If already in an event loop, run on the background loop thread
+            future = asyncio.run_coroutine_threadsafe(
+                updater.update_context(tool_name, tool_input, tool_output),
+                _get_background_loop(),
+            )
+            return future.result(timeout=2.0)  # 2 second timeout
         except RuntimeError:
             # No event loop is running, create a new one
             return asyncio.run(
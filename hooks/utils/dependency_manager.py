@@ -14,19 +14,33 @@ Features:
 - Cross-platform compatibility
 """
 
+import functools
 import importlib
-import shutil
-import subprocess
+import importlib.metadata
+import importlib.util
+import io
+import shlex
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import pkg_resources
 
+# Dependency report banner
+_REPORT_RULE = "=" * 60
+_REPORT_HEADER = "\n".join(
+    [_REPORT_RULE, "CLAUDE CODE HOOKS - DEPENDENCY REPORT", _REPORT_RULE, ""]
+)
 
-@dataclass
+# Accepted answers to the interactive install prompt
+_YES_ANSWERS: frozenset[str] = frozenset({"y", "yes"})
+
+# Package managers the report and install commands know about
+_PACKAGE_MANAGERS = ("pip", "pip3", "conda", "pipenv")
+
+
+@dataclass(frozen=True)
 class Dependency:
     """Represents a package dependency with installation and fallback options."""
 
@@ -39,6 +53,12 @@ class Dependency:
     fallback_available: bool = False
     fallback_message: str = ""
     install_instructions: str = ""
+    effective_import_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "effective_import_name", self.import_name or self.name
+        )
 
 
 class DependencyManager:
@@ -55,47 +75,12 @@ class DependencyManager:
         self._available_packages = {}
         self._missing_packages = {}
         self._fallback_handlers = {}
+        self._available_managers: dict[str, bool] | None = None
+        self._manager_versions: dict[str, str | None] | None = None
+        self._install_commands: dict[Dependency, str | None] = {}
 
-        # Define common dependencies for Claude hooks
-        self.common_dependencies = [
-            Dependency(
-                name="requests",
-                pip_name="requests",
-                conda_name="requests",
-                required=False,
-                fallback_available=True,
-                fallback_message="HTTP requests will use urllib instead of requests library",
-                install_instructions="pip install requests",
-            ),
-            Dependency(
-                name="colorama",
-                pip_name="colorama",
-                conda_name="colorama",
-                required=False,
-                fallback_available=True,
-                fallback_message="Console output will not be colored",
-                install_instructions="pip install colorama",
-            ),
-            Dependency(
-                name="rich",
-                pip_name="rich",
-                conda_name="rich",
-                required=False,
-                fallback_available=True,
-                fallback_message="Console output will use basic formatting",
-                install_instructions="pip install rich",
-            ),
-            Dependency(
-                name="gitpython",
-                import_name="git",
-                pip_name="GitPython",
-                conda_name="gitpython",
-                required=False,
-                fallback_available=True,
-                fallback_message="Git operations will use subprocess calls",
-                install_instructions="pip install GitPython",
-            ),
-        ]
+        # Common dependencies for Claude hooks, shared by every manager
+        self.common_dependencies = _COMMON_DEPENDENCIES
 
     def check_dependencies(
         self, dependencies: list[Dependency] | None = None
@@ -123,7 +108,7 @@ class DependencyManager:
         }
 
         for dep in dependencies:
-            import_name = dep.import_name or dep.name
+            import_name = dep.effective_import_name
             is_available = self._check_package_availability(import_name)
 
             result["available"][dep.name] = is_available
@@ -192,7 +177,7 @@ class DependencyManager:
                     answer = input(
                         f"\nInstall {dep.name}? ({dep.install_instructions}) [y/N]: "
                     )
-                    if answer.lower() not in ["y", "yes"]:
+                    if answer.strip().lower() not in _YES_ANSWERS:
                         result["skipped"].append(dep.name)
                         continue
 
@@ -256,31 +241,30 @@ class DependencyManager:
 
         dep_status = self.check_dependencies(dependencies)
 
-        report = []
-        report.append("=" * 60)
-        report.append("CLAUDE CODE HOOKS - DEPENDENCY REPORT")
-        report.append("=" * 60)
+        buf = io.StringIO()
+        buf.write(_REPORT_HEADER)
 
         # Overall status
         if dep_status["all_required_available"]:
-            report.append("\n✅ All required dependencies are available")
+            buf.write("\n✅ All required dependencies are available\n")
         else:
-            report.append("\n⚠️  Some required dependencies are missing")
+            buf.write("\n⚠️  Some required dependencies are missing\n")
 
         # Available packages
         available = [name for name, status in dep_status["available"].items() if status]
         if available:
-            report.append(f"\n📦 Available Packages ({len(available)}):")
+            buf.write(f"\n📦 Available Packages ({len(available)}):\n")
             for name in available:
                 version = dep_status["versions"].get(name, "unknown")
-                report.append(f"   ✅ {name} (version: {version})")
+                buf.write(f"   ✅ {name} (version: {version})\n")
 
         # Missing packages
         missing = list(dep_status["missing"].keys())
         if missing:
-            report.append(f"\n❌ Missing Packages ({len(missing)}):")
+            buf.write(f"\n❌ Missing Packages ({len(missing)}):\n")
+            by_name = {d.name: d for d in dependencies}
             for name in missing:
-                dep = next((d for d in dependencies if d.name == name), None)
+                dep = by_name.get(name)
                 status_msg = dep_status["missing"][name]
 
                 if dep:
@@ -290,115 +274,123 @@ class DependencyManager:
                         if dep.fallback_available
                         else "No fallback"
                     )
-                    report.append(f"   ❌ {name} ({required_text}, {fallback_text})")
-                    report.append(f"      Status: {status_msg}")
+                    buf.write(f"   ❌ {name} ({required_text}, {fallback_text})\n")
+                    buf.write(f"      Status: {status_msg}\n")
 
                     if dep.fallback_available and dep.fallback_message:
-                        report.append(f"      Fallback: {dep.fallback_message}")
+                        buf.write(f"      Fallback: {dep.fallback_message}\n")
 
                     if name in dep_status["install_commands"]:
-                        report.append(
-                            f"      Install: {dep_status['install_commands'][name]}"
+                        buf.write(
+                            f"      Install: {dep_status['install_commands'][name]}\n"
                         )
                 else:
-                    report.append(f"   ❌ {name}: {status_msg}")
+                    buf.write(f"   ❌ {name}: {status_msg}\n")
 
         # Installation commands
         install_commands = dep_status["install_commands"]
         if install_commands:
-            report.append("\n🔧 Installation Commands:")
+            buf.write("\n🔧 Installation Commands:\n")
             for name, cmd in install_commands.items():
-                report.append(f"   {name}: {cmd}")
+                buf.write(f"   {name}: {cmd}\n")
 
         # Package manager detection
-        report.append("\n🛠️  Package Manager Information:")
-        managers = self._detect_package_managers()
-        for manager, info in managers.items():
-            status = "Available" if info["available"] else "Not found"
-            report.append(f"   • {manager}: {status}")
-            if info["available"] and info.get("version"):
-                report.append(f"     Version: {info['version']}")
+        buf.write("\n🛠️  Package Manager Information:\n")
+        versions = self._detect_manager_versions()
+        for manager, available in self._detect_available_managers().items():
+            status = "Available" if available else "Not found"
+            buf.write(f"   • {manager}: {status}\n")
+            if available and versions.get(manager):
+                buf.write(f"     Version: {versions[manager]}\n")
 
-        report.append("\n" + "=" * 60)
-        return "\n".join(report)
+        buf.write(f"\n{_REPORT_RULE}")
+        return buf.getvalue()
 
     def _check_package_availability(self, package_name: str) -> bool:
         """Check if a package is available for import."""
         if package_name in self._available_packages:
             return self._available_packages[package_name]
 
+        # Resolve the module spec only; importing would run the package's code
         try:
-            importlib.import_module(package_name)
-            self._available_packages[package_name] = True
-            return True
-        except ImportError:
-            self._available_packages[package_name] = False
-            return False
+            available = importlib.util.find_spec(package_name) is not None
+        except (ImportError, ValueError):
+            available = False
+
+        self._available_packages[package_name] = available
+        return available
 
     def _get_package_version(self, package_name: str) -> str | None:
         """Get the version of an installed package."""
-        try:
-            # Try pkg_resources first
-            return pkg_resources.get_distribution(package_name).version
-        except (pkg_resources.DistributionNotFound, Exception):
-            try:
-                # Try importlib.metadata (Python 3.8+)
-                if sys.version_info >= (3, 8):
-                    import importlib.metadata
+        # A package already found missing has no version to look up
+        if self._available_packages.get(package_name) is False:
+            return None
 
-                    return importlib.metadata.version(package_name)
-            except Exception:
-                pass
+        try:
+            # Distribution metadata, without pkg_resources' startup scan
+            return importlib.metadata.version(package_name)
+        except importlib.metadata.PackageNotFoundError:
+            pass
 
-            try:
-                # Try importing and checking __version__
+        try:
+            # Fall back to the module's __version__ (e.g. import name "git"),
+            # reusing the module if it is already imported
+            module = sys.modules.get(package_name)
+            if module is None:
                 module = importlib.import_module(package_name)
-                if hasattr(module, "__version__"):
-                    return module.__version__
-            except Exception:
-                pass
+            return getattr(module, "__version__", None)
+        except Exception:
+            return None
 
-        return None
-
-    def _is_version_compatible(self, current_version: str, min_version: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_version_compatible(current_version: str, min_version: str) -> bool:
         """Check if current version meets minimum requirement."""
-        try:
-            from packaging import version
+        # Compare numeric release components; non-numeric parts are ignored
+        current_parts = [int(x) for x in current_version.split(".") if x.isdigit()]
+        min_parts = [int(x) for x in min_version.split(".") if x.isdigit()]
 
-            return version.parse(current_version) >= version.parse(min_version)
-        except ImportError:
-            # Fallback to simple string comparison
-            current_parts = [int(x) for x in current_version.split(".") if x.isdigit()]
-            min_parts = [int(x) for x in min_version.split(".") if x.isdigit()]
-
-            # Pad shorter version with zeros
-            max_len = max(len(current_parts), len(min_parts))
-            current_parts.extend([0] * (max_len - len(current_parts)))
-            min_parts.extend([0] * (max_len - len(min_parts)))
+        # Pad shorter version with zeros
+        max_len = max(len(current_parts), len(min_parts))
+        current_parts.extend([0] * (max_len - len(current_parts)))
+        min_parts.extend([0] * (max_len - len(min_parts)))
 
-            return current_parts >= min_parts
+        return tuple(current_parts) >= tuple(min_parts)
 
     def _generate_install_command(self, dependency: Dependency) -> str | None:
-        """Generate installation command for a dependency."""
-        managers = self._detect_package_managers()
+        """Generate installation command for a dependency, cached per manager."""
+        if dependency in self._install_commands:
+            return self._install_commands[dependency]
+
+        managers = self._detect_available_managers()
+        install_cmd = None
 
         # Prefer conda if available and conda_name is specified
-        if managers["conda"]["available"] and dependency.conda_name:
-            return f"conda install {dependency.conda_name}"
+        if managers["conda"] and dependency.conda_name:
+            install_cmd = f"conda install {dependency.conda_name}"
+
+        # Use this interpreter's pip, so packages land where the hooks import them
+        elif self._check_package_availability("pip"):
+            package_name = dependency.pip_name or dependency.name
+            python_cmd = shlex.quote(sys.executable)
+            install_cmd = f"{python_cmd} -m pip install {package_name}"
 
-        # Use pip if available
-        if managers["pip"]["available"] or managers["pip3"]["available"]:
-            pip_cmd = "pip3" if managers["pip3"]["available"] else "pip"
+        # Otherwise use pip from PATH if available
+        elif managers["pip"] or managers["pip3"]:
+            pip_cmd = "pip3" if managers["pip3"] else "pip"
             package_name = dependency.pip_name or dependency.name
-            return f"{pip_cmd} install {package_name}"
+            install_cmd = f"{pip_cmd} install {package_name}"
 
-        return None
+        self._install_commands[dependency] = install_cmd
+        return install_cmd
 
     def _run_install_command(self, command: str) -> bool:
         """Run an installation command."""
+        import subprocess
+
         try:
             result = subprocess.run(
-                command.split(),
+                shlex.split(command),
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
@@ -411,40 +403,99 @@ class DependencyManager:
         ):
             return False
 
-    def _detect_package_managers(self) -> dict[str, dict[str, Any]]:
-        """Detect available package managers."""
-        managers = {
-            "pip": {"available": False, "version": None},
-            "pip3": {"available": False, "version": None},
-            "conda": {"available": False, "version": None},
-            "pipenv": {"available": False, "version": None},
-        }
+    def _detect_available_managers(self) -> dict[str, bool]:
+        """Detect which package managers are on PATH, without running them."""
+        if self._available_managers is None:
+            import shutil
 
-        for manager in managers.keys():
-            if shutil.which(manager):
-                managers[manager]["available"] = True
+            self._available_managers = {
+                manager: shutil.which(manager) is not None
+                for manager in _PACKAGE_MANAGERS
+            }
+        return self._available_managers
 
-                # Try to get version
-                try:
-                    result = subprocess.run(
-                        [manager, "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    if result.returncode == 0:
-                        managers[manager]["version"] = result.stdout.strip()
-                except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                    pass
+    def _detect_manager_versions(self) -> dict[str, str | None]:
+        """Get the version of each available package manager, probing once."""
+        if self._manager_versions is not None:
+            return self._manager_versions
+
+        import subprocess
 
-        return managers
+        versions: dict[str, str | None] = {}
+        for manager, available in self._detect_available_managers().items():
+            versions[manager] = None
+            if not available:
+                continue
+
+            try:
+                result = subprocess.run(
+                    [manager, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+                if result.returncode == 0:
+                    versions[manager] = result.stdout.strip()
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+                pass
+
+        self._manager_versions = versions
+        return versions
+
+
+# Define common dependencies for Claude hooks
+_COMMON_DEPENDENCIES: tuple[Dependency, ...] = (
+    Dependency(
+        name="requests",
+        pip_name="requests",
+        conda_name="requests",
+        required=False,
+        fallback_available=True,
+        fallback_message="HTTP requests will use urllib instead of requests library",
+        install_instructions="pip install requests",
+    ),
+    Dependency(
+        name="colorama",
+        pip_name="colorama",
+        conda_name="colorama",
+        required=False,
+        fallback_available=True,
+        fallback_message="Console output will not be colored",
+        install_instructions="pip install colorama",
+    ),
+    Dependency(
+        name="rich",
+        pip_name="rich",
+        conda_name="rich",
+        required=False,
+        fallback_available=True,
+        fallback_message="Console output will use basic formatting",
+        install_instructions="pip install rich",
+    ),
+    Dependency(
+        name="gitpython",
+        import_name="git",
+        pip_name="GitPython",
+        conda_name="gitpython",
+        required=False,
+        fallback_available=True,
+        fallback_message="Git operations will use subprocess calls",
+        install_instructions="pip install GitPython",
+    ),
+)
 
 
 # Fallback implementations for common packages
 class FallbackImplementations:
-    """Provides fallback implementations for common packages."""
+    """
+    Provides fallback implementations for common packages.
+
+    Each fallback is built once and cached, so its imports and nested class
+    definitions only run on the first call.
+    """
 
     @staticmethod
+    @functools.cache
     def requests_fallback():
         """Fallback for requests library using urllib."""
         import json
@@ -500,6 +551,7 @@ class FallbackImplementations:
         return FallbackRequests
 
     @staticmethod
+    @functools.cache
     def colorama_fallback():
         """Fallback for colorama - no coloring."""
 
@@ -537,6 +589,7 @@ class FallbackImplementations:
         return FallbackColorama
 
     @staticmethod
+    @functools.cache
     def rich_fallback():
         """Fallback for rich - basic print functionality."""
 
@@ -557,6 +610,7 @@ class FallbackImplementations:
         return FallbackRich
 
     @staticmethod
+    @functools.cache
     def git_fallback():
         """Fallback for GitPython using subprocess."""
         import subprocess
@@ -609,11 +663,23 @@ def setup_default_fallbacks(manager: DependencyManager):
     manager.register_fallback_handler("git", FallbackImplementations.git_fallback)
 
 
+# Shared manager, so convenience calls reuse its availability and manager caches
+_default_manager: DependencyManager | None = None
+
+
+def get_default_manager() -> DependencyManager:
+    """Get the process-wide dependency manager with default fallbacks."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = DependencyManager()
+        setup_default_fallbacks(_default_manager)
+    return _default_manager
+
+
 # Convenience functions
 def check_dependencies(dependencies: list[Dependency] | None = None) -> dict[str, Any]:
     """Quick function to check dependencies."""
-    manager = DependencyManager()
-    return manager.check_dependencies(dependencies)
+    return get_default_manager().check_dependencies(dependencies)
 
 
 def install_missing_dependencies(
@@ -622,18 +688,16 @@ def install_missing_dependencies(
     dry_run: bool = False,
 ) -> dict[str, Any]:
     """Quick function to install missing dependencies."""
-    manager = DependencyManager()
-    return manager.install_missing_dependencies(dependencies, interactive, dry_run)
+    return get_default_manager().install_missing_dependencies(
+        dependencies, interactive, dry_run
+    )
 
 
 def generate_dependency_report(dependencies: list[Dependency] | None = None) -> str:
     """Quick function to generate dependency report."""
-    manager = DependencyManager()
-    return manager.generate_dependency_report(dependencies)
+    return get_default_manager().generate_dependency_report(dependencies)
 
 
 if __name__ == "__main__":
     # CLI interface for testing
-    manager = DependencyManager()
-    setup_default_fallbacks(manager)
-    print(manager.generate_dependency_report())
+    print(get_default_manager().generate_dependency_report())
@@ -1,71 +1,99 @@
 #!/usr/bin/env python3
 """Utility to load environment paths from .env.claude file."""
 
+import importlib
+import importlib.util
 import os
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
-from dotenv import load_dotenv
 
-# Import our robust project root finder
-try:
-    from utils.find_project_root import ProjectRootFinder
+def find_project_root():
+    """Find the project root by looking for .env.claude or .git directory."""
+    # Start from this file's location (4 levels up: utils -> hooks -> .claude -> project root)
+    current = Path(__file__).parent.parent.parent.parent
+
+    # Walk up the directory tree looking for .env.claude or .git
+    for parent in chain((current,), current.parents):
+        if (parent / ".env.claude").exists() or (parent / ".git").exists():
+            return parent
+
+    # Use the calculated path if no markers found
+    return current
+
+
+def _load_project_root_finder():
+    """Import ProjectRootFinder, probing with find_spec instead of failed imports."""
+    # Try with and without the utils prefix (for different import contexts)
+    for module_name in ("utils.find_project_root", "find_project_root"):
+        package = module_name.rpartition(".")[0]
+        if package and importlib.util.find_spec(package) is None:
+            continue
+        if importlib.util.find_spec(module_name) is None:
+            continue
+        try:
+            return importlib.import_module(module_name).ProjectRootFinder
+        except ImportError:
+            # The module exists but failed to import; try the next candidate
+            continue
+    return None
+
+
+def _locate_project_root():
+    """Locate the project root, preferring ProjectRootFinder when importable."""
+    # Use our robust project root finder when it is importable
+    finder_class = _load_project_root_finder()
+    if finder_class is not None:
+        project_root = finder_class().find_project_root()
+    else:
+        # Fallback to using file location to find project root
+        project_root = find_project_root()
 
-    root_finder = ProjectRootFinder()
-    PROJECT_ROOT = root_finder.find_project_root()
-except ImportError:
-    # Try without utils prefix (for different import contexts)
-    try:
-        from find_project_root import ProjectRootFinder
+    # Ensure the project root is not None
+    if project_root is None:
+        # Use the file's location to find project root (4 levels up from utils/env_loader.py)
+        project_root = Path(__file__).parent.parent.parent.parent
+    return project_root
 
-        root_finder = ProjectRootFinder()
-        PROJECT_ROOT = root_finder.find_project_root()
-    except ImportError:
-        # Fallback to using file location to find project root
-        def find_project_root():
-            """Find the project root by looking for .env.claude or .git directory."""
-            # Start from this file's location (4 levels up: utils -> hooks -> .claude -> project root)
-            current = Path(__file__).parent.parent.parent.parent
 
-            # Walk up the directory tree looking for .env.claude or .git
-            for parent in [current] + list(current.parents):
-                if (parent / ".env.claude").exists() or (parent / ".git").exists():
-                    return parent
+def _load_env_file():
+    """Load .env.claude (or .env) into os.environ, importing dotenv only if needed."""
+    env_path = ENV_CLAUDE_PATH
+    if not env_path.exists():
+        # Fallback to .env if .env.claude doesn't exist
+        env_path = PROJECT_ROOT / ".env"
+        if not env_path.exists():
+            return
+
+    from dotenv import load_dotenv
 
-            # Use the calculated path if no markers found
-            return current
+    load_dotenv(env_path)
 
-        PROJECT_ROOT = find_project_root()
 
-# Ensure PROJECT_ROOT is not None
-if PROJECT_ROOT is None:
-    # Use the file's location to find project root (4 levels up from utils/env_loader.py)
-    PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+PROJECT_ROOT = _locate_project_root()
 ENV_CLAUDE_PATH = PROJECT_ROOT / ".env.claude"
 
-if ENV_CLAUDE_PATH.exists():
-    load_dotenv(ENV_CLAUDE_PATH)
-else:
-    # Fallback to .env if .env.claude doesn't exist
-    env_path = PROJECT_ROOT / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
+# Load at import so callers reading os.getenv() directly see the configured values
+_load_env_file()
 
 
+@lru_cache(maxsize=1)
 def get_ai_data_path():
     """
     Get the AI_DATA path from .env.claude file.
     Falls back to 'logs' if not set.
     Always relative to project root, not current working directory.
+    The result is cached per process; call get_ai_data_path.cache_clear()
+    to re-read the environment.
     """
 
     # Get AI_DATA from environment, default to 'logs'
-    ai_data_path = os.getenv("AI_DATA", "logs")
+    ai_data_path = Path(os.getenv("AI_DATA", "logs"))
 
-    # Convert to Path object and ensure it's absolute
-    if not os.path.isabs(ai_data_path):
+    # Ensure it's absolute, anchoring relative values at the project root
+    if not ai_data_path.is_absolute():
         ai_data_path = PROJECT_ROOT / ai_data_path
-    else:
-        ai_data_path = Path(ai_data_path)
 
     # Ensure the directory exists
     ai_data_path.mkdir(parents=True, exist_ok=True)
@@ -73,6 +101,7 @@ def get_ai_data_path():
     return ai_data_path
 
 
+@lru_cache(maxsize=1)
 def get_ai_docs_path():
     """
     Get the AI_DOCS path from .env.claude file.
@@ -80,13 +109,11 @@ def get_ai_docs_path():
     Always relative to project root, not current working directory.
     """
     # Get AI_DOCS from environment, default to 'ai_docs'
-    ai_docs_path = os.getenv("AI_DOCS", "ai_docs")
+    ai_docs_path = Path(os.getenv("AI_DOCS", "ai_docs"))
 
-    # Convert to Path object and ensure it's absolute
-    if not os.path.isabs(ai_docs_path):
+    # Ensure it's absolute, anchoring relative values at the project root
+    if not ai_docs_path.is_absolute():
         ai_docs_path = PROJECT_ROOT / ai_docs_path
-    else:
-        ai_docs_path = Path(ai_docs_path)
 
     # Ensure the directory exists
     ai_docs_path.mkdir(parents=True, exist_ok=True)
@@ -94,6 +121,7 @@ def get_ai_docs_path():
     return ai_docs_path
 
 
+@lru_cache(maxsize=1)
 def get_log_path():
     """
     Get the LOG_PATH from .env.claude file.
@@ -101,13 +129,11 @@ def get_log_path():
     Always relative to project root, not current working directory.
     """
     # Get LOG_PATH from environment, default to 'logs'
-    log_path = os.getenv("LOG_PATH", "logs")
+    log_path = Path(os.getenv("LOG_PATH", "logs"))
 
-    # Convert to Path object and ensure it's absolute
-    if not os.path.isabs(log_path):
+    # Ensure it's absolute, anchoring relative values at the project root
+    if not log_path.is_absolute():
         log_path = PROJECT_ROOT / log_path
-    else:
-        log_path = Path(log_path)
 
     # Ensure the directory exists
     log_path.mkdir(parents=True, exist_ok=True)
@@ -119,6 +145,7 @@ def get_all_paths():
     """
     Get all configured paths as a dictionary.
     Returns dict with 'ai_data', 'ai_docs', and 'log_path' keys.
+    Built fresh from the cached getters, so callers may modify it.
     """
     return {
         "ai_data": get_ai_data_path(),
@@ -139,6 +166,6 @@ def is_claude_edit_enabled():
 def get_project_root():
     """
     Get the project root directory.
-    Returns the cached PROJECT_ROOT that was found at module load time.
+    Returns the project root located when the module was imported.
     """
     return PROJECT_ROOT
@@ -15,17 +15,160 @@ Features:
 """
 
 import os
-import platform
+import re
 import shutil
-import subprocess
 import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from threading import Thread
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+
+# Horizontal rule framing the environment report
+_SEP = "=" * 70
+
+# Marker files that indicate a project root
+_PROJECT_MARKERS = frozenset(
+    {
+        "CLAUDE.md",  # Most specific to Claude projects
+        ".env.dev",  # Development environment marker
+        ".env.claude",  # Claude-specific environment
+        "CLAUDE.local.md",  # Local Claude configuration
+        ".git",  # Git repository root
+        "package.json",  # Node.js project
+        "pyproject.toml",  # Python project
+        "docker-compose.yml",  # Docker project
+        ".env",  # General environment file
+    }
+)
+
+
+def _list_dir_names(path: Path) -> set[str]:
+    """Return the entry names of a directory, or an empty set if unreadable."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _read_head_branch(git_root: Path) -> str | None:
+    """
+    Read the current branch name from the repository's HEAD file.
+
+    Returns:
+        The branch name, "" for a detached HEAD, or None if HEAD can't be parsed
+    """
+    try:
+        git_path = git_root / ".git"
+        if git_path.is_file():
+            # Worktrees and submodules point at their git directory
+            pointer = git_path.read_text().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_path = git_root / pointer[len("gitdir:") :].strip()
+        head = (git_path / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/") :]
+    if head.startswith("ref:"):
+        return None
+    return ""
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Locate an executable on PATH, memoized for the life of the process."""
+    return shutil.which(name)
+
+
+# python, python3 or python3.X, optionally with a Windows .exe suffix
+_PYTHON_EXE_RE = re.compile(r"^python(?:3(?:\.\d+)?)?(?:\.exe)?$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _scan_path_for_pythons() -> tuple[str, ...]:
+    """Collect Python executable names with one directory listing per PATH entry."""
+    found = set()
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if (
+                        _PYTHON_EXE_RE.match(entry.name)
+                        and entry.is_file()
+                        and os.access(entry.path, os.X_OK)
+                    ):
+                        found.add(entry.name.lower().removesuffix(".exe"))
+        except OSError:
+            continue
+    # Order as python, python3, then python3.X by minor version
+    return tuple(
+        sorted(
+            found,
+            key=lambda name: [int(part) for part in name[6:].split(".") if part],
+        )
+    )
+
+
+# Standard library modules this detector relies on
+_STDLIB_PACKAGES = ("json", "pathlib", "subprocess", "os", "sys", "platform")
+
+# Third-party runtime dependencies of the hooks, by import name
+_RUNTIME_PACKAGES = ("dotenv", "psutil", "yaml", "requests")
+
+
+@lru_cache(maxsize=1)
+def _probe_python_packages() -> dict[str, bool]:
+    """Check package availability without importing anything."""
+    packages = dict.fromkeys(_STDLIB_PACKAGES, True)
+    for package in _RUNTIME_PACKAGES:
+        packages[package] = find_spec(package) is not None
+    return packages
+
+
+@lru_cache(maxsize=None)
+def _find_project_root_cached(cwd: str, script: str) -> Path | None:
+    """Find the project root directory, memoized per working directory."""
+    # Start from current directory and this script's location
+    start_paths = [
+        Path(cwd),
+        Path(script).parent.parent.parent if script else Path(cwd),
+    ]
+
+    for start in start_paths:
+        try:
+            current = start.resolve()
+
+            # Walk up the directory tree, listing each directory once
+            while current != current.parent:
+                names = _list_dir_names(current)
+
+                # Verify it's a Claude project by checking for .claude directory
+                if ".claude" in names and not names.isdisjoint(_PROJECT_MARKERS):
+                    return current
+
+                current = current.parent
+
+        except (OSError, PermissionError):
+            continue
+
+    return None
 
 
 class EnvironmentDetector:
     """Comprehensive environment detection for Claude Code hooks."""
 
+    # Detection results shared by all instances, keyed by project root
+    _GLOBAL_CACHE: ClassVar[dict[Path | None, dict[str, Any]]] = {}
+
     def __init__(self, project_root: Path | None = None):
         """
         Initialize environment detector.
@@ -34,7 +177,16 @@ class EnvironmentDetector:
             project_root: Optional project root path. If not provided, will be auto-detected.
         """
         self.project_root = project_root or self._find_project_root()
-        self._cache = {}
+        self._cache = self._GLOBAL_CACHE.setdefault(self.project_root, {})
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached detection results, e.g. between tests."""
+        cls._GLOBAL_CACHE.clear()
+        _find_project_root_cached.cache_clear()
+        _which.cache_clear()
+        _scan_path_for_pythons.cache_clear()
+        _probe_python_packages.cache_clear()
 
     def get_environment_info(self) -> dict[str, Any]:
         """
@@ -43,32 +195,47 @@ class EnvironmentDetector:
         Returns:
             Dictionary containing all environment details
         """
-        return {
-            "platform": self.get_platform_info(),
-            "python": self.get_python_info(),
-            "virtual_env": self.get_virtual_env_info(),
-            "git": self.get_git_info(),
-            "project": self.get_project_info(),
-            "dependencies": self.get_dependency_info(),
-            "claude_structure": self.get_claude_structure_info(),
+        getters = {
+            "platform": self.get_platform_info,
+            "python": self.get_python_info,
+            "virtual_env": self.get_virtual_env_info,
+            "git": self.get_git_info,
+            "project": self.get_project_info,
+            "dependencies": self.get_dependency_info,
+            "claude_structure": self.get_claude_structure_info,
         }
-
-    def get_platform_info(self) -> dict[str, str]:
+        cold = [getter for key, getter in getters.items() if key not in self._cache]
+        if len(cold) > 1:
+            # The sections are independent and mostly wait on subprocesses and
+            # the filesystem, so fill the cache concurrently first
+            threads = [Thread(target=getter, daemon=True) for getter in cold]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        return {key: getter() for key, getter in getters.items()}
+
+    def get_platform_info(self) -> Mapping[str, Any]:
         """Get operating system and platform information."""
         if "platform" in self._cache:
             return self._cache["platform"]
 
+        import platform
+
+        system = platform.system()  # Windows, Darwin, Linux
         info = {
-            "system": platform.system(),  # Windows, Darwin, Linux
+            "system": system,
             "release": platform.release(),
             "version": platform.version(),
             "machine": platform.machine(),  # x86_64, arm64, etc.
             "processor": platform.processor(),
-            "architecture": platform.architecture()[0],  # 64bit, 32bit
+            # Interpreter pointer width; platform.architecture() may run file(1)
+            "architecture": "64bit" if sys.maxsize > 2**32 else "32bit",
             "python_implementation": platform.python_implementation(),  # CPython, PyPy
-            "is_windows": platform.system() == "Windows",
-            "is_macos": platform.system() == "Darwin",
-            "is_linux": platform.system() == "Linux",
+            "is_windows": system == "Windows",
+            "is_macos": system == "Darwin",
+            "is_linux": system == "Linux",
             "path_separator": os.sep,
             "path_list_separator": os.pathsep,
         }
@@ -76,20 +243,21 @@ class EnvironmentDetector:
         # Detect Windows Subsystem for Linux (WSL)
         if info["is_linux"]:
             try:
-                with open("/proc/version") as f:
-                    version_info = f.read().lower()
-                    info["is_wsl"] = (
-                        "microsoft" in version_info or "wsl" in version_info
-                    )
-            except (FileNotFoundError, PermissionError):
+                fd = os.open("/proc/version", os.O_RDONLY)
+                try:
+                    # /proc/version is a single short line
+                    version_info = os.read(fd, 256).lower()
+                finally:
+                    os.close(fd)
+                info["is_wsl"] = b"microsoft" in version_info or b"wsl" in version_info
+            except OSError:
                 info["is_wsl"] = False
         else:
             info["is_wsl"] = False
 
-        self._cache["platform"] = info
-        return info
+        return self._cache.setdefault("platform", MappingProxyType(info))
 
-    def get_python_info(self) -> dict[str, Any]:
+    def get_python_info(self) -> Mapping[str, Any]:
         """Get Python executable and version information."""
         if "python" in self._cache:
             return self._cache["python"]
@@ -97,14 +265,15 @@ class EnvironmentDetector:
         info = {
             "executable": sys.executable,
             "version": sys.version,
-            "version_info": {
-                "major": sys.version_info.major,
-                "minor": sys.version_info.minor,
-                "micro": sys.version_info.micro,
-            },
+            "version_info": MappingProxyType(
+                {
+                    "major": sys.version_info.major,
+                    "minor": sys.version_info.minor,
+                    "micro": sys.version_info.micro,
+                }
+            ),
             "prefix": sys.prefix,
             "exec_prefix": sys.exec_prefix,
-            "path": sys.path.copy(),
             "available_executables": self._find_python_executables(),
         }
 
@@ -112,10 +281,9 @@ class EnvironmentDetector:
         exe_name = Path(sys.executable).name.lower()
         info["is_python3"] = "python3" in exe_name or info["version_info"]["major"] >= 3
 
-        self._cache["python"] = info
-        return info
+        return self._cache.setdefault("python", MappingProxyType(info))
 
-    def get_virtual_env_info(self) -> dict[str, Any]:
+    def get_virtual_env_info(self) -> Mapping[str, Any]:
         """Detect virtual environment type and details."""
         if "virtual_env" in self._cache:
             return self._cache["virtual_env"]
@@ -155,81 +323,77 @@ class EnvironmentDetector:
             info["path"] = os.environ["VIRTUAL_ENV"]
             info["name"] = Path(os.environ["VIRTUAL_ENV"]).name
 
-        self._cache["virtual_env"] = info
-        return info
+        return self._cache.setdefault("virtual_env", MappingProxyType(info))
 
-    def get_git_info(self) -> dict[str, Any]:
+    def get_git_info(self) -> Mapping[str, Any]:
         """Get Git repository information."""
         if "git" in self._cache:
             return self._cache["git"]
 
+        import subprocess
+
         info = {
             "is_git_repo": False,
             "is_submodule": False,
-            "git_available": shutil.which("git") is not None,
+            "git_available": _which("git") is not None,
             "root_path": None,
             "current_branch": None,
             "is_dirty": False,
-            "submodules": [],
+            "submodules": (),
         }
 
         if not info["git_available"] or not self.project_root:
-            self._cache["git"] = info
-            return info
+            return self._cache.setdefault("git", MappingProxyType(info))
 
         try:
             # Check if we're in a git repository
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 cwd=self.project_root,
                 timeout=10,
             )
 
             if result.returncode == 0:
                 info["is_git_repo"] = True
-                info["root_path"] = Path(result.stdout.strip())
-
-                # Get current branch
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_root,
-                    timeout=5,
+                info["root_path"] = Path(os.fsdecode(result.stdout.strip()))
+
+                # The branch is normally read straight from HEAD
+                info["current_branch"] = _read_head_branch(info["root_path"])
+
+                # Dirty state (and the branch, if HEAD was unreadable) comes
+                # from a single status call, run alongside the submodule
+                # listing. Submodules can only exist when .gitmodules does, so
+                # skip that git call otherwise.
+                commands = [["git", "status", "--porcelain=v2", "--branch"]]
+                if (info["root_path"] / ".gitmodules").exists():
+                    commands.append(["git", "submodule", "status"])
+                status_output, *submodule_outputs = self._run_git_commands(
+                    *commands, timeout=10
                 )
-                if branch_result.returncode == 0:
-                    info["current_branch"] = branch_result.stdout.strip()
-
-                # Check if working directory is dirty
-                status_result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_root,
-                    timeout=5,
-                )
-                if status_result.returncode == 0:
-                    info["is_dirty"] = bool(status_result.stdout.strip())
-
-                # Check for submodules
-                submodules_result = subprocess.run(
-                    ["git", "submodule", "status"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_root,
-                    timeout=10,
-                )
-                if (
-                    submodules_result.returncode == 0
-                    and submodules_result.stdout.strip()
-                ):
-                    info["submodules"] = [
+                submodules_output = submodule_outputs[0] if submodule_outputs else None
+                if status_output is not None:
+                    entries = status_output.splitlines()
+                    if info["current_branch"] is None:
+                        for line in entries:
+                            if line.startswith("# branch.head "):
+                                branch = line[len("# branch.head ") :]
+                                # Detached HEAD has no current branch
+                                info["current_branch"] = (
+                                    "" if branch == "(detached)" else branch
+                                )
+                                break
+                    info["is_dirty"] = any(
+                        line and not line.startswith("#") for line in entries
+                    )
+
+                if submodules_output and submodules_output.strip():
+                    info["submodules"] = tuple(
                         line.split()[1]
-                        for line in submodules_result.stdout.strip().split("\n")
+                        for line in submodules_output.strip().split("\n")
                         if line.strip()
-                    ]
+                    )
 
                 # Check if .claude is a submodule
                 claude_dir = self.project_root / ".claude"
@@ -243,10 +407,43 @@ class EnvironmentDetector:
         ):
             pass
 
-        self._cache["git"] = info
-        return info
+        return self._cache.setdefault("git", MappingProxyType(info))
+
+    def _run_git_commands(
+        self, *commands: list[str], timeout: float
+    ) -> list[str | None]:
+        """
+        Run git commands concurrently in the project root.
+
+        Returns:
+            The stdout of each command, or None for commands that failed
+        """
+        import subprocess
 
-    def get_project_info(self) -> dict[str, Any]:
+        procs = [
+            subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.project_root,
+            )
+            for command in commands
+        ]
+        outputs = []
+        try:
+            for proc in procs:
+                stdout, _ = proc.communicate(timeout=timeout)
+                outputs.append(
+                    stdout.decode(errors="replace") if proc.returncode == 0 else None
+                )
+        finally:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+        return outputs
+
+    def get_project_info(self) -> Mapping[str, Any]:
         """Get project structure and configuration information."""
         if "project" in self._cache:
             return self._cache["project"]
@@ -266,8 +463,7 @@ class EnvironmentDetector:
         }
 
         if not self.project_root:
-            self._cache["project"] = info
-            return info
+            return self._cache.setdefault("project", MappingProxyType(info))
 
         # Check for various project files
         files_to_check = {
@@ -282,8 +478,9 @@ class EnvironmentDetector:
             "has_dockerfile": "Dockerfile",
         }
 
+        names = _list_dir_names(self.project_root)
         for key, filename in files_to_check.items():
-            info[key] = (self.project_root / filename).exists()
+            info[key] = filename in names
 
         # Determine project type
         if info["has_package_json"]:
@@ -297,39 +494,34 @@ class EnvironmentDetector:
         elif info["has_docker_compose"]:
             info["project_type"] = "docker"
 
-        self._cache["project"] = info
-        return info
+        return self._cache.setdefault("project", MappingProxyType(info))
 
-    def get_dependency_info(self) -> dict[str, Any]:
+    def get_dependency_info(self) -> Mapping[str, Any]:
         """Check for required dependencies and tools."""
         if "dependencies" in self._cache:
             return self._cache["dependencies"]
 
-        info = {
-            "available_tools": {},
-            "python_packages": {},
-            "missing_requirements": [],
-        }
-
         # Check for common tools
         tools_to_check = ["git", "python3", "python", "pip", "pip3", "conda", "pipenv"]
-        for tool in tools_to_check:
-            info["available_tools"][tool] = shutil.which(tool) is not None
+        available_tools = {tool: _which(tool) is not None for tool in tools_to_check}
 
-        # Check for Python packages (only commonly available ones to avoid import errors)
-        packages_to_check = ["json", "pathlib", "subprocess", "os", "sys", "platform"]
-        for package in packages_to_check:
-            try:
-                __import__(package)
-                info["python_packages"][package] = True
-            except ImportError:
-                info["python_packages"][package] = False
-                info["missing_requirements"].append(package)
+        # Check for Python packages; the stdlib ones are always importable
+        python_packages = _probe_python_packages()
 
-        self._cache["dependencies"] = info
-        return info
+        # Nested values are read-only too, since the info is shared process-wide
+        info = {
+            "available_tools": MappingProxyType(available_tools),
+            "python_packages": MappingProxyType(dict(python_packages)),
+            "missing_requirements": tuple(
+                package
+                for package, available in python_packages.items()
+                if not available
+            ),
+        }
 
-    def get_claude_structure_info(self) -> dict[str, Any]:
+        return self._cache.setdefault("dependencies", MappingProxyType(info))
+
+    def get_claude_structure_info(self) -> Mapping[str, Any]:
         """Get information about Claude directory structure."""
         if "claude_structure" in self._cache:
             return self._cache["claude_structure"]
@@ -347,26 +539,24 @@ class EnvironmentDetector:
         }
 
         if not self.project_root:
-            self._cache["claude_structure"] = info
-            return info
+            return self._cache.setdefault("claude_structure", MappingProxyType(info))
 
         claude_dir = self.project_root / ".claude"
         info["claude_dir_exists"] = claude_dir.exists()
 
         if info["claude_dir_exists"]:
-            hooks_dir = claude_dir / "hooks"
-            info["hooks_dir_exists"] = hooks_dir.exists()
+            claude_names = _list_dir_names(claude_dir)
+            info["hooks_dir_exists"] = "hooks" in claude_names
 
             if info["hooks_dir_exists"]:
-                info["utils_dir_exists"] = (hooks_dir / "utils").exists()
-                info["config_dir_exists"] = (hooks_dir / "config").exists()
-                info["setup_hooks_exists"] = (hooks_dir / "setup_hooks.py").exists()
-                info["execute_hook_exists"] = (hooks_dir / "execute_hook.py").exists()
+                hooks_names = _list_dir_names(claude_dir / "hooks")
+                info["utils_dir_exists"] = "utils" in hooks_names
+                info["config_dir_exists"] = "config" in hooks_names
+                info["setup_hooks_exists"] = "setup_hooks.py" in hooks_names
+                info["execute_hook_exists"] = "execute_hook.py" in hooks_names
 
-            info["settings_json_exists"] = (claude_dir / "settings.json").exists()
-            info["settings_sample_exists"] = (
-                claude_dir / "settings.json.sample"
-            ).exists()
+            info["settings_json_exists"] = "settings.json" in claude_names
+            info["settings_sample_exists"] = "settings.json.sample" in claude_names
 
             # Determine if this is a complete installation
             required_components = [
@@ -378,69 +568,15 @@ class EnvironmentDetector:
             ]
             info["is_complete_installation"] = all(required_components)
 
-        self._cache["claude_structure"] = info
-        return info
+        return self._cache.setdefault("claude_structure", MappingProxyType(info))
 
     def _find_project_root(self) -> Path | None:
         """Find the project root directory."""
-        # Marker files that indicate project root (ordered by priority)
-        markers = [
-            "CLAUDE.md",  # Most specific to Claude projects
-            ".env.dev",  # Development environment marker
-            ".env.claude",  # Claude-specific environment
-            "CLAUDE.local.md",  # Local Claude configuration
-            ".git",  # Git repository root
-            "package.json",  # Node.js project
-            "pyproject.toml",  # Python project
-            "docker-compose.yml",  # Docker project
-            ".env",  # General environment file
-        ]
-
-        # Start from current directory and this script's location
-        start_paths = [
-            Path.cwd(),
-            Path(__file__).parent.parent.parent if __file__ else Path.cwd(),
-        ]
-
-        for start in start_paths:
-            try:
-                current = start.resolve()
-
-                # Walk up the directory tree
-                while current != current.parent:
-                    # Check for marker files in priority order
-                    for marker in markers:
-                        marker_path = current / marker
-                        if marker_path.exists():
-                            # Verify it's a Claude project by checking for .claude directory
-                            claude_dir = current / ".claude"
-                            if claude_dir.exists():
-                                return current
-
-                    current = current.parent
+        return _find_project_root_cached(str(Path.cwd()), __file__ or "")
 
-            except (OSError, PermissionError):
-                continue
-
-        return None
-
-    def _find_python_executables(self) -> list[str]:
+    def _find_python_executables(self) -> tuple[str, ...]:
         """Find all available Python executables."""
-        executables = []
-        common_names = [
-            "python",
-            "python3",
-            "python3.9",
-            "python3.10",
-            "python3.11",
-            "python3.12",
-        ]
-
-        for name in common_names:
-            if shutil.which(name):
-                executables.append(name)
-
-        return executables
+        return _scan_path_for_pythons()
 
     def get_recommended_python_executable(self) -> str:
         """Get the recommended Python executable for this environment."""
@@ -463,15 +599,21 @@ class EnvironmentDetector:
         # Fallback to current executable
         return sys.executable
 
-    def validate_environment(self) -> tuple[bool, list[str]]:
+    def validate_environment(
+        self, env_info: dict[str, Any] | None = None
+    ) -> tuple[bool, list[str]]:
         """
         Validate that the environment is suitable for Claude hooks.
 
+        Args:
+            env_info: Optional result of get_environment_info() to validate
+
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
         issues = []
-        env_info = self.get_environment_info()
+        if env_info is None:
+            env_info = self.get_environment_info()
 
         # Check Python version
         if env_info["python"]["version_info"]["major"] < 3:
@@ -513,120 +655,120 @@ class EnvironmentDetector:
     def generate_environment_report(self) -> str:
         """Generate a comprehensive environment report."""
         env_info = self.get_environment_info()
-        is_valid, issues = self.validate_environment()
-
-        report = []
-        report.append("=" * 70)
-        report.append("CLAUDE CODE HOOKS - ENVIRONMENT REPORT")
-        report.append("=" * 70)
+        is_valid, issues = self.validate_environment(env_info)
 
         # Validation status
-        report.append(
-            f"\n✅ Environment Status: {'VALID' if is_valid else 'ISSUES FOUND'}"
+        issue_lines = (
+            ("\n⚠️  Issues:", *(f"   • {issue}" for issue in issues)) if issues else ()
         )
-        if issues:
-            report.append("\n⚠️  Issues:")
-            for issue in issues:
-                report.append(f"   • {issue}")
 
         # Platform information
         platform = env_info["platform"]
-        report.append("\n🖥️  Platform Information:")
-        report.append(f"   • System: {platform['system']} {platform['release']}")
-        report.append(
-            f"   • Architecture: {platform['machine']} ({platform['architecture']})"
-        )
-        if platform.get("is_wsl"):
-            report.append("   • WSL Detected: Yes")
+        architecture = f"{platform['machine']} ({platform['architecture']})"
+        wsl_lines = ("   • WSL Detected: Yes",) if platform.get("is_wsl") else ()
 
         # Python information
         python = env_info["python"]
-        report.append("\n🐍 Python Information:")
-        report.append(f"   • Current Executable: {python['executable']}")
-        report.append(
-            f"   • Version: {python['version_info']['major']}.{python['version_info']['minor']}.{python['version_info']['micro']}"
-        )
-        report.append(
-            f"   • Available Executables: {', '.join(python['available_executables'])}"
+        version_info = python["version_info"]
+        python_version = (
+            f"{version_info['major']}.{version_info['minor']}.{version_info['micro']}"
         )
 
         # Virtual environment
         venv = env_info["virtual_env"]
         if venv["is_virtual_env"]:
-            report.append("\n🔒 Virtual Environment:")
-            report.append(f"   • Type: {venv['type']}")
-            report.append(f"   • Name: {venv['name']}")
-            report.append(f"   • Path: {venv['path']}")
+            venv_lines = (
+                "\n🔒 Virtual Environment:",
+                f"   • Type: {venv['type']}",
+                f"   • Name: {venv['name']}",
+                f"   • Path: {venv['path']}",
+            )
         else:
-            report.append("\n🔒 Virtual Environment: Not detected")
+            venv_lines = ("\n🔒 Virtual Environment: Not detected",)
 
         # Git information
         git = env_info["git"]
-        report.append("\n📁 Git Repository:")
-        report.append(f"   • Git Available: {'Yes' if git['git_available'] else 'No'}")
         if git["is_git_repo"]:
-            report.append(f"   • Repository Root: {git['root_path']}")
-            report.append(f"   • Current Branch: {git['current_branch']}")
-            report.append(
-                f"   • Working Directory: {'Dirty' if git['is_dirty'] else 'Clean'}"
+            git_lines = (
+                f"   • Repository Root: {git['root_path']}",
+                f"   • Current Branch: {git['current_branch']}",
+                f"   • Working Directory: {'Dirty' if git['is_dirty'] else 'Clean'}",
             )
             if git["submodules"]:
-                report.append(f"   • Submodules: {', '.join(git['submodules'])}")
+                git_lines += (f"   • Submodules: {', '.join(git['submodules'])}",)
         else:
-            report.append("   • Repository: Not detected")
+            git_lines = ("   • Repository: Not detected",)
 
         # Project information
         project = env_info["project"]
-        report.append("\n📦 Project Information:")
-        report.append(f"   • Root Path: {project['root_path']}")
-        report.append(f"   • Project Type: {project['project_type']}")
-        config_files = [k for k, v in project.items() if k.startswith("has_") and v]
-        if config_files:
-            report.append(
-                f"   • Configuration Files: {', '.join([k.replace('has_', '').replace('_', '.') for k in config_files])}"
-            )
+        config_files = ", ".join(
+            key[4:].replace("_", ".")
+            for key, present in project.items()
+            if key.startswith("has_") and present
+        )
+        config_lines = (
+            (f"   • Configuration Files: {config_files}",) if config_files else ()
+        )
 
         # Claude structure
         claude = env_info["claude_structure"]
-        report.append("\n🤖 Claude Structure:")
-        report.append(
-            f"   • Complete Installation: {'Yes' if claude['is_complete_installation'] else 'No'}"
-        )
-        report.append(
-            f"   • Settings Configured: {'Yes' if claude['settings_json_exists'] else 'No'}"
-        )
+        complete = "Yes" if claude["is_complete_installation"] else "No"
+        configured = "Yes" if claude["settings_json_exists"] else "No"
 
         # Dependencies
-        deps = env_info["dependencies"]
-        available_tools = [
-            tool for tool, available in deps["available_tools"].items() if available
-        ]
-        report.append(
-            f"\n🔧 Available Tools: {', '.join(available_tools) if available_tools else 'None'}"
+        available_tools = ", ".join(
+            tool
+            for tool, available in env_info["dependencies"]["available_tools"].items()
+            if available
         )
 
-        report.append("\n" + "=" * 70)
-
-        return "\n".join(report)
+        return "\n".join(
+            (
+                _SEP,
+                "CLAUDE CODE HOOKS - ENVIRONMENT REPORT",
+                _SEP,
+                f"\n✅ Environment Status: {'VALID' if is_valid else 'ISSUES FOUND'}",
+                *issue_lines,
+                "\n🖥️  Platform Information:",
+                f"   • System: {platform['system']} {platform['release']}",
+                f"   • Architecture: {architecture}",
+                *wsl_lines,
+                "\n🐍 Python Information:",
+                f"   • Current Executable: {python['executable']}",
+                f"   • Version: {python_version}",
+                "   • Available Executables: "
+                + ", ".join(python["available_executables"]),
+                *venv_lines,
+                "\n📁 Git Repository:",
+                f"   • Git Available: {'Yes' if git['git_available'] else 'No'}",
+                *git_lines,
+                "\n📦 Project Information:",
+                f"   • Root Path: {project['root_path']}",
+                f"   • Project Type: {project['project_type']}",
+                *config_lines,
+                "\n🤖 Claude Structure:",
+                f"   • Complete Installation: {complete}",
+                f"   • Settings Configured: {configured}",
+                f"\n🔧 Available Tools: {available_tools or 'None'}",
+                "\n" + _SEP,
+            )
+        )
 
 
 # Convenience functions for quick access
 def detect_environment(project_root: Path | None = None) -> dict[str, Any]:
     """Quick function to get environment information."""
-    detector = EnvironmentDetector(project_root)
-    return detector.get_environment_info()
+    return EnvironmentDetector(project_root).get_environment_info()
 
 
 def validate_environment(project_root: Path | None = None) -> tuple[bool, list[str]]:
     """Quick function to validate environment."""
-    detector = EnvironmentDetector(project_root)
-    return detector.validate_environment()
+    return EnvironmentDetector(project_root).validate_environment()
 
 
 def generate_environment_report(project_root: Path | None = None) -> str:
     """Quick function to generate environment report."""
-    detector = EnvironmentDetector(project_root)
-    return detector.generate_environment_report()
+    return EnvironmentDetector(project_root).generate_environment_report()
 
 
 if __name__ == "__main__":
@@ -5,17 +5,26 @@ This prevents the nested ./.claude/hooks/ path issue.
 """
 
 import json
+import shutil
 import sys
 from pathlib import Path
 
 # Add hooks directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from find_project_root import ProjectRootFinder
+
+def _hook_entry(command: str, matcher: str | None = "") -> dict:
+    """Build a hook configuration entry running a single command."""
+    hooks = [{"type": "command", "command": command}]
+    if matcher is None:
+        return {"hooks": hooks}
+    return {"matcher": matcher, "hooks": hooks}
 
 
 def generate_settings():
     """Generate settings.json with relative paths for portability."""
+    from find_project_root import ProjectRootFinder
+
     finder = ProjectRootFinder()
 
     # Find project root
@@ -32,6 +41,9 @@ def generate_settings():
         print(f"Error: Hooks directory not found: {hooks_dir}", file=sys.stderr)
         sys.exit(1)
 
+    # Every hook runs through the execute_hook.py wrapper
+    exec_hook = str(hooks_dir / "execute_hook.py")
+
     # Generate settings with relative paths for portability
     settings = {
         "permissions": {
@@ -53,98 +65,29 @@ def generate_settings():
         },
         "statusLine": {
             "type": "command",
-            "command": f"python3 {hooks_dir / 'execute_hook.py'} status_line_mcp.py",
+            "command": f"python3 {exec_hook} status_line_mcp.py",
             "padding": 0,
         },
         "includeCoAuthoredBy": False,
         "hooks": {
-            "PreToolUse": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} pre_tool_use.py",
-                        }
-                    ],
-                }
-            ],
-            "PostToolUse": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} post_tool_use.py",
-                        }
-                    ],
-                }
-            ],
+            "PreToolUse": [_hook_entry(f"python3 {exec_hook} pre_tool_use.py")],
+            "PostToolUse": [_hook_entry(f"python3 {exec_hook} post_tool_use.py")],
             "Notification": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} notification.py --notify",
-                        }
-                    ],
-                }
-            ],
-            "Stop": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} stop.py --chat",
-                        }
-                    ],
-                }
+                _hook_entry(f"python3 {exec_hook} notification.py --notify")
             ],
+            "Stop": [_hook_entry(f"python3 {exec_hook} stop.py --chat")],
             "SubagentStop": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} subagent_stop.py --notify",
-                        }
-                    ],
-                }
+                _hook_entry(f"python3 {exec_hook} subagent_stop.py --notify")
             ],
             "UserPromptSubmit": [
-                {
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} user_prompt_submit.py --log-only --store-last-prompt --name-agent",
-                        }
-                    ]
-                }
-            ],
-            "PreCompact": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} pre_compact.py",
-                        }
-                    ],
-                }
-            ],
-            "SessionStart": [
-                {
-                    "matcher": "",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": f"python3 {hooks_dir / 'execute_hook.py'} session_start.py",
-                        }
-                    ],
-                }
+                _hook_entry(
+                    f"python3 {exec_hook} user_prompt_submit.py"
+                    " --log-only --store-last-prompt --name-agent",
+                    matcher=None,
+                )
             ],
+            "PreCompact": [_hook_entry(f"python3 {exec_hook} pre_compact.py")],
+            "SessionStart": [_hook_entry(f"python3 {exec_hook} session_start.py")],
         },
     }
 
@@ -168,12 +111,11 @@ def main():
             # Backup existing settings
             if settings_path.exists():
                 backup_path = settings_path.with_suffix(".json.backup")
-                backup_path.write_text(settings_path.read_text())
+                shutil.copyfile(settings_path, backup_path)
                 print(f"Backed up existing settings to: {backup_path}")
 
-            # Write new settings
-            with open(settings_path, "w") as f:
-                json.dump(settings, f, indent=2)
+            # Write new settings in one call rather than per encoder chunk
+            settings_path.write_text(json.dumps(settings, indent=2))
 
             print(f"Generated new settings.json with wrapper approach: {settings_path}")
             print(
@@ -8,12 +8,15 @@ Architecture Reference: Section 15.2 in mcp-auto-injection-architecture.md
 Task ID: bd70c110-c43b-4ec9-b5bc-61cdb03a0833
 """
 
+import asyncio
 import json
 import logging
 import os
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 import requests
@@ -35,18 +38,82 @@ class MCPAuthenticationError(Exception):
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds a cached .mcp.json token is trusted before the file's mtime is rechecked
+TOKEN_RECHECK_S = 30.0
+
+
+def _find_mcp_json_path() -> Path | None:
+    """Locate .mcp.json in the project root or up to 3 parent directories."""
+    from .env_loader import get_project_root
+
+    project_root = get_project_root()
+    for directory in (project_root, *list(project_root.parents)[:3]):
+        mcp_json_path = directory / ".mcp.json"
+        if mcp_json_path.exists():
+            return mcp_json_path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_debug_logger() -> logging.Logger | None:
+    """Return the token-extraction debug logger if APP_LOG_LEVEL=DEBUG, else None."""
+    if os.getenv("APP_LOG_LEVEL", "").upper() != "DEBUG":
+        return None
+
+    # Get log directory from centralized env_loader
+    from .env_loader import get_ai_data_path
+
+    debug_logger = logging.getLogger("mcp_client.token_extraction")
+    debug_logger.setLevel(logging.DEBUG)
+
+    # Only add handler if not already added
+    if not debug_logger.handlers:
+        handler = logging.FileHandler(get_ai_data_path() / "mcp_client_auth_debug.log")
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        )
+        debug_logger.addHandler(handler)
+
+    return debug_logger
+
 
 class TokenManager:
     """Manages JWT tokens for hook-to-MCP communication by reading from .mcp.json."""
 
-    def __init__(self):
-        # No cache needed - always read fresh from .mcp.json
-        pass
+    # Parsed token shared by all instances, revalidated against the file's mtime
+    _cached_token: str | None = None
+    _cached_path: Path | None = None
+    _cached_mtime_ns: int | None = None
+    _checked_at = 0.0
+    _cache_lock = Lock()
 
     def get_valid_token(self) -> str:
-        """Get JWT token directly from .mcp.json file (no caching)."""
-        # Always read fresh token from .mcp.json - no cache complexity
-        token = self._get_mcp_json_token()
+        """Get JWT token from .mcp.json, reparsing only when the file changes."""
+        with TokenManager._cache_lock:
+            token = TokenManager._cached_token
+            now = time.monotonic()
+            if token and now - TokenManager._checked_at < TOKEN_RECHECK_S:
+                return token
+
+            # Reparse only if .mcp.json moved or was modified since last read
+            try:
+                mcp_json_path = _find_mcp_json_path()
+                mtime_ns = mcp_json_path.stat().st_mtime_ns if mcp_json_path else None
+            except Exception:
+                mcp_json_path = mtime_ns = None
+            if (
+                not token
+                or mtime_ns is None
+                or mcp_json_path != TokenManager._cached_path
+                or mtime_ns != TokenManager._cached_mtime_ns
+            ):
+                token = self._get_mcp_json_token(mcp_json_path)
+
+            TokenManager._cached_token = token
+            TokenManager._cached_path = mcp_json_path
+            TokenManager._cached_mtime_ns = mtime_ns
+            TokenManager._checked_at = now
 
         if not token:
             raise MCPAuthenticationError(
@@ -55,172 +122,142 @@ class TokenManager:
 
         return token
 
-    def _get_mcp_json_token(self) -> str | None:
-        """Extract Bearer token from .mcp.json file if available with comprehensive debug logging."""
-        # Set up debug logging (conditional on APP_LOG_LEVEL=DEBUG)
-        DEBUG_ENABLED = os.getenv("APP_LOG_LEVEL", "").upper() == "DEBUG"
-        debug_logger = None
+    def _request_new_token(self) -> None:
+        """Drop the cached token so the next lookup rereads .mcp.json."""
+        with TokenManager._cache_lock:
+            TokenManager._cached_token = None
 
-        if DEBUG_ENABLED:
-            # Get log directory from centralized env_loader
-            from .env_loader import get_ai_data_path
+    def _get_mcp_json_token(self, mcp_json_path: Path | None) -> str | None:
+        """Extract Bearer token from the already located .mcp.json, if any."""
+        try:
+            debug_logger = _get_debug_logger()
+            if debug_logger:
+                return self._get_mcp_json_token_debug(debug_logger)
 
-            log_dir = get_ai_data_path()
-            debug_log = log_dir / "mcp_client_auth_debug.log"
+            if mcp_json_path is None:
+                return None
 
-            debug_logger = logging.getLogger("mcp_client.token_extraction")
-            debug_logger.setLevel(logging.DEBUG)
+            with open(mcp_json_path) as f:
+                mcp_config = json.load(f)
 
-            # Only add handler if not already added
-            if not debug_logger.handlers:
-                handler = logging.FileHandler(debug_log)
-                handler.setLevel(logging.DEBUG)
-                formatter = logging.Formatter(
-                    "%(asctime)s - %(levelname)s - %(message)s"
-                )
-                handler.setFormatter(formatter)
-                debug_logger.addHandler(handler)
+            # Extract token from agenthub_http configuration
+            auth_header = (
+                mcp_config.get("mcpServers", {})
+                .get("agenthub_http", {})
+                .get("headers", {})
+                .get("Authorization", "")
+            )
+            if auth_header.startswith("Bearer "):
+                return auth_header.replace("Bearer ", "")
+        except Exception as e:
+            logger.debug("Could not read .mcp.json token: %s", e)
 
+        return None
+
+    def _get_mcp_json_token_debug(self, debug_logger: logging.Logger) -> str | None:
+        """Extract Bearer token from .mcp.json, logging every step of the lookup."""
         try:
-            if debug_logger:
-                debug_logger.debug("=" * 80)
-                debug_logger.debug("TokenManager._get_mcp_json_token() CALLED")
+            debug_logger.debug("=" * 80)
+            debug_logger.debug("TokenManager._get_mcp_json_token() CALLED")
 
             # Look for .mcp.json in project root
             from .env_loader import get_project_root
 
             project_root = get_project_root()
-
-            if debug_logger:
-                debug_logger.debug(f"Starting directory: {project_root}")
+            debug_logger.debug("Starting directory: %s", project_root)
 
             mcp_json_path = project_root / ".mcp.json"
-
-            if debug_logger:
-                debug_logger.debug(f"Looking for .mcp.json at: {mcp_json_path}")
-                debug_logger.debug(f"File exists: {mcp_json_path.exists()}")
+            debug_logger.debug("Looking for .mcp.json at: %s", mcp_json_path)
+            debug_logger.debug("File exists: %s", mcp_json_path.exists())
 
             # Try parent directories if not found
             search_attempts = 0
             if not mcp_json_path.exists():
-                if debug_logger:
-                    debug_logger.debug(
-                        "File not found in current directory, searching parent directories..."
-                    )
+                debug_logger.debug(
+                    "File not found in current directory, searching parent directories..."
+                )
 
-                for i in range(3):
+                for _ in range(3):
                     search_attempts += 1
                     project_root = project_root.parent
                     mcp_json_path = project_root / ".mcp.json"
 
-                    if debug_logger:
-                        debug_logger.debug(
-                            f"Search attempt {search_attempts}: {mcp_json_path}"
-                        )
-                        debug_logger.debug(f"  Exists: {mcp_json_path.exists()}")
+                    debug_logger.debug(
+                        "Search attempt %d: %s", search_attempts, mcp_json_path
+                    )
+                    debug_logger.debug("  Exists: %s", mcp_json_path.exists())
 
                     if mcp_json_path.exists():
-                        if debug_logger:
-                            debug_logger.debug(
-                                f"✅ Found .mcp.json at: {mcp_json_path}"
-                            )
+                        debug_logger.debug("✅ Found .mcp.json at: %s", mcp_json_path)
                         break
 
             if not mcp_json_path.exists():
-                if debug_logger:
-                    debug_logger.debug(
-                        f"❌ .mcp.json NOT FOUND after {search_attempts + 1} attempts"
-                    )
-                    debug_logger.debug(f"Final search path: {mcp_json_path}")
+                debug_logger.debug(
+                    "❌ .mcp.json NOT FOUND after %d attempts", search_attempts + 1
+                )
+                debug_logger.debug("Final search path: %s", mcp_json_path)
                 return None
 
-            if debug_logger:
-                debug_logger.debug(f"Reading .mcp.json from: {mcp_json_path}")
+            debug_logger.debug("Reading .mcp.json from: %s", mcp_json_path)
+            with open(mcp_json_path) as f:
+                mcp_config = json.load(f)
 
-            if mcp_json_path.exists():
-                with open(mcp_json_path) as f:
-                    mcp_config = json.load(f)
+            debug_logger.debug("JSON loaded successfully")
+            debug_logger.debug("Top-level keys: %s", list(mcp_config))
 
-                if debug_logger:
-                    debug_logger.debug("JSON loaded successfully")
-                    debug_logger.debug(f"Top-level keys: {list(mcp_config.keys())}")
+            if "mcpServers" in mcp_config:
+                servers = mcp_config["mcpServers"]
+                debug_logger.debug("mcpServers keys: %s", list(servers))
 
-                    if "mcpServers" in mcp_config:
-                        debug_logger.debug(
-                            f"mcpServers keys: {list(mcp_config['mcpServers'].keys())}"
-                        )
+                if "agenthub_http" in servers:
+                    debug_logger.debug(
+                        "agenthub_http keys: %s", list(servers["agenthub_http"])
+                    )
+
+                    if "headers" in servers["agenthub_http"]:
+                        headers = servers["agenthub_http"]["headers"]
+                        debug_logger.debug("headers keys: %s", list(headers))
 
-                        if "agenthub_http" in mcp_config["mcpServers"]:
+                        if "Authorization" in headers:
+                            # Log first 20 chars only for security
                             debug_logger.debug(
-                                f"agenthub_http keys: {list(mcp_config['mcpServers']['agenthub_http'].keys())}"
+                                "Authorization header found: %s...",
+                                headers["Authorization"][:20],
                             )
-
-                            if "headers" in mcp_config["mcpServers"]["agenthub_http"]:
-                                headers = mcp_config["mcpServers"]["agenthub_http"][
-                                    "headers"
-                                ]
-                                debug_logger.debug(
-                                    f"headers keys: {list(headers.keys())}"
-                                )
-
-                                if "Authorization" in headers:
-                                    auth_value = headers["Authorization"]
-                                    # Log first 20 chars only for security
-                                    debug_logger.debug(
-                                        f"Authorization header found: {auth_value[:20]}..."
-                                    )
-                                else:
-                                    debug_logger.debug(
-                                        "❌ Authorization key NOT found in headers"
-                                    )
-                            else:
-                                debug_logger.debug(
-                                    "❌ headers key NOT found in agenthub_http"
-                                )
                         else:
                             debug_logger.debug(
-                                "❌ agenthub_http key NOT found in mcpServers"
+                                "❌ Authorization key NOT found in headers"
                             )
                     else:
-                        debug_logger.debug("❌ mcpServers key NOT found in JSON")
+                        debug_logger.debug("❌ headers key NOT found in agenthub_http")
+                else:
+                    debug_logger.debug("❌ agenthub_http key NOT found in mcpServers")
+            else:
+                debug_logger.debug("❌ mcpServers key NOT found in JSON")
 
-                # Extract token from agenthub_http configuration
-                agenthub_config = mcp_config.get("mcpServers", {}).get(
-                    "agenthub_http", {}
-                )
-                auth_header = agenthub_config.get("headers", {}).get(
-                    "Authorization", ""
-                )
+            # Extract token from agenthub_http configuration
+            agenthub_config = mcp_config.get("mcpServers", {}).get(
+                "agenthub_http", {}
+            )
+            auth_header = agenthub_config.get("headers", {}).get("Authorization", "")
 
-                if debug_logger:
-                    if auth_header:
-                        debug_logger.debug(
-                            f"✅ Extracted auth_header: {auth_header[:20]}..."
-                        )
-                    else:
-                        debug_logger.debug("❌ auth_header is None or empty")
+            if auth_header:
+                debug_logger.debug("✅ Extracted auth_header: %s...", auth_header[:20])
+            else:
+                debug_logger.debug("❌ auth_header is None or empty")
 
-                if auth_header.startswith("Bearer "):
-                    token = auth_header.replace("Bearer ", "")
-                    if debug_logger:
-                        debug_logger.debug(
-                            f"✅ Token extracted successfully: {token[:20]}..."
-                        )
-                        debug_logger.debug("=" * 80)
-                    return token
-                else:
-                    if debug_logger:
-                        debug_logger.debug(
-                            "❌ Authorization header does not start with 'Bearer '"
-                        )
-                        debug_logger.debug("=" * 80)
+            if auth_header.startswith("Bearer "):
+                token = auth_header.replace("Bearer ", "")
+                debug_logger.debug("✅ Token extracted successfully: %s...", token[:20])
+                debug_logger.debug("=" * 80)
+                return token
+
+            debug_logger.debug("❌ Authorization header does not start with 'Bearer '")
+            debug_logger.debug("=" * 80)
 
         except Exception as e:
-            if debug_logger:
-                debug_logger.debug(f"❌ EXCEPTION in _get_mcp_json_token(): {e}")
-                debug_logger.exception("Full traceback:")
-            else:
-                logger.debug(f"Could not read .mcp.json token: {e}")
+            debug_logger.debug("❌ EXCEPTION in _get_mcp_json_token(): %s", e)
+            debug_logger.exception("Full traceback:")
 
         return None
 
@@ -232,24 +269,27 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests = []
+        # Requests may be checked from several threads (make_request_async)
+        self._lock = Lock()
 
     def allow_request(self) -> bool:
         """Check if request is allowed under rate limit."""
-        current_time = time.time()
-
-        # Remove old requests outside time window
-        self.requests = [
-            req_time
-            for req_time in self.requests
-            if current_time - req_time < self.time_window
-        ]
-
-        # Check if under limit
-        if len(self.requests) < self.max_requests:
-            self.requests.append(current_time)
-            return True
+        with self._lock:
+            current_time = time.time()
 
-        return False
+            # Remove old requests outside time window
+            self.requests = [
+                req_time
+                for req_time in self.requests
+                if current_time - req_time < self.time_window
+            ]
+
+            # Check if under limit
+            if len(self.requests) < self.max_requests:
+                self.requests.append(current_time)
+                return True
+
+            return False
 
 
 class MCPHTTPClient:
@@ -269,6 +309,9 @@ class MCPHTTPClient:
 
         self.token_manager = TokenManager()
         self.session = requests.Session()
+        self._authenticated = False
+        # Guards the auth state and Authorization header across threads
+        self._auth_lock = Lock()
         self.timeout = int(os.getenv("MCP_SERVER_TIMEOUT", "10"))
         self.max_retries = int(os.getenv("MCP_MAX_RETRIES", "3"))
         self.retry_delay = float(os.getenv("MCP_RETRY_DELAY", "1.0"))
@@ -328,13 +371,27 @@ class MCPHTTPClient:
 
     def authenticate(self) -> bool:
         """Authenticate with .mcp.json token."""
-        try:
-            token = self.token_manager.get_valid_token()
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
-            return True
-        except MCPAuthenticationError as e:
-            logger.error(f"Authentication failed: {e}")
-            return False
+        with self._auth_lock:
+            try:
+                token = self.token_manager.get_valid_token()
+                self.session.headers.update({"Authorization": f"Bearer {token}"})
+                self._authenticated = True
+                return True
+            except MCPAuthenticationError as e:
+                logger.error(f"Authentication failed: {e}")
+                self._authenticated = False
+                return False
+
+    def _ensure_authenticated(self) -> bool:
+        """Authenticate on first use; the session keeps the header afterwards."""
+        return self._authenticated or self.authenticate()
+
+    def _check_unauthorized(self, response: requests.Response) -> None:
+        """Force re-authentication on the next call if the token was rejected."""
+        if response.status_code == 401:
+            with self._auth_lock:
+                self._authenticated = False
+                self.token_manager._request_new_token()
 
     def query_pending_tasks(
         self, limit: int = 5, user_id: str | None = None
@@ -356,7 +413,7 @@ class MCPHTTPClient:
                 mcp_request["params"]["arguments"]["user_id"] = user_id
 
             # Authenticate and send MCP request
-            if self.authenticate():
+            if self._ensure_authenticated():
                 # Update headers for MCP protocol
                 self.session.headers.update(
                     {"Accept": "application/json, text/event-stream"}
@@ -365,6 +422,7 @@ class MCPHTTPClient:
                 response = self.session.post(
                     f"{self.base_url}/mcp", json=mcp_request, timeout=self.timeout
                 )
+                self._check_unauthorized(response)
 
                 if response.status_code == 200:
                     result = response.json()
@@ -402,7 +460,7 @@ class MCPHTTPClient:
 
     def query_project_context(self, project_id: str | None = None) -> dict | None:
         """Query project context via MCP protocol."""
-        if not self.authenticate():
+        if not self._ensure_authenticated():
             return None
 
         try:
@@ -428,6 +486,7 @@ class MCPHTTPClient:
             response = self.session.post(
                 f"{self.base_url}/mcp", json=mcp_request, timeout=self.timeout
             )
+            self._check_unauthorized(response)
 
             if response.status_code == 200:
                 result = response.json()
@@ -449,7 +508,7 @@ class MCPHTTPClient:
 
     def query_git_branch_info(self) -> dict | None:
         """Query git branch information via MCP protocol."""
-        if not self.authenticate():
+        if not self._ensure_authenticated():
             return None
 
         try:
@@ -472,6 +531,7 @@ class MCPHTTPClient:
             response = self.session.post(
                 f"{self.base_url}/mcp", json=mcp_request, timeout=self.timeout
             )
+            self._check_unauthorized(response)
 
             if response.status_code == 200:
                 result = response.json()
@@ -495,7 +555,7 @@ class MCPHTTPClient:
         self, git_branch_id: str, user_id: str | None = None
     ) -> dict | None:
         """Get next recommended task via MCP protocol."""
-        if not self.authenticate():
+        if not self._ensure_authenticated():
             return None
 
         try:
@@ -525,6 +585,7 @@ class MCPHTTPClient:
             response = self.session.post(
                 f"{self.base_url}/mcp", json=mcp_request, timeout=self.timeout
             )
+            self._check_unauthorized(response)
 
             if response.status_code == 200:
                 result = response.json()
@@ -595,7 +656,7 @@ class MCPHTTPClient:
 
     def make_request(self, endpoint: str, payload: dict) -> dict | None:
         """Make authenticated HTTP request to MCP server with retry."""
-        if not self.authenticate():
+        if not self._ensure_authenticated():
             return None
 
         def _request():
@@ -607,7 +668,7 @@ class MCPHTTPClient:
                 if response.status_code == 401:
                     # Token expired, try to refresh and retry once
                     logger.info("Token expired, attempting refresh")
-                    self.token_manager._request_new_token()
+                    self._check_unauthorized(response)
                     if self.authenticate():
                         response = self.session.post(
                             f"{self.base_url}{endpoint}",
@@ -627,6 +688,10 @@ class MCPHTTPClient:
 
         return self._execute_with_retry(_request)
 
+    async def make_request_async(self, endpoint: str, payload: dict) -> dict | None:
+        """Make a request without blocking the event loop, so calls can overlap."""
+        return await asyncio.to_thread(self.make_request, endpoint, payload)
+
 
 class ResilientMCPClient(MCPHTTPClient):
     """HTTP client for MCP server - uses hook endpoint directly."""
@@ -0,0 +1,36 @@
+"""Tests for the file-pattern matcher in hooks/utils/context_updater.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "hooks"))
+
+context_updater = pytest.importorskip("utils.context_updater")
+_build_matcher = context_updater._build_matcher
+
+
+def test_suffix_pattern_matches_md_files():
+    matcher = _build_matcher([r".*\.md$"])
+    assert matcher("ai_docs/guide.md")
+    assert not matcher("guide.mdx")
+    assert not matcher("guide_md")
+
+
+def test_substring_pattern_matches_ai_docs_paths():
+    matcher = _build_matcher([r".*/ai_docs/.*"])
+    assert matcher("/project/ai_docs/setup.txt")
+    assert not matcher("ai_docs")
+
+
+def test_digit_class_suffix_is_not_treated_as_literal():
+    matcher = _build_matcher([r".*\d$"])
+    assert matcher("abc1")
+    assert not matcher("abcd")
+
+
+def test_word_class_substring_is_not_treated_as_literal():
+    matcher = _build_matcher([r".*\w.*"])
+    assert matcher("a")
+    assert not matcher("--")